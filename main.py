@@ -38,7 +38,7 @@ sys.path.insert(0, str(src_path))
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QDir
 from ui.main_window import MainWindow
-from ui.theme import Theme
+from ui.theme import get_default_theme
 from core.settings_manager import SettingsManager
 from core.db_manager import DatabaseManager
 
@@ -55,9 +55,9 @@ def main():
     settings_manager = SettingsManager()
     db_manager = DatabaseManager(settings_manager.get_database_path())
     
-    # Apply theme globally to the entire application
-    theme = Theme()
-    app.setStyleSheet(theme.get_stylesheet())
+    # Apply theme globally to the entire application, once; windows and dialogs
+    # inherit it rather than setting their own copy
+    get_default_theme().apply_global_stylesheet(app)
     
     # Create main window
     print("Creating MainWindow...")
@@ -5,13 +5,92 @@ Scanned ROMs Manager for Romplestiltskin
 Manages persistent storage of scanned ROM data to enable filtering across all ROM tabs.
 """
 
+import json
 import sqlite3
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Iterable, Tuple
 from contextlib import contextmanager
 from .rom_scanner import ROMScanResult, ROMStatus
 
 
+class ConnectionPool:
+    """Reusable SQLite connections to one database, one per thread.
+    
+    Connections are opened on first use in a thread and kept for the life of
+    that thread, so repeated queries skip the open and keep their page cache.
+    """
+    
+    _pools: Dict[str, "ConnectionPool"] = {}
+    _pools_lock = threading.Lock()
+    
+    # Applied to every new connection. With WAL, NORMAL only syncs at
+    # checkpoints and is still safe against corruption.
+    _CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous = NORMAL;"
+        "PRAGMA temp_store = MEMORY;"
+        "PRAGMA mmap_size = 268435456;"  # 256 MB
+        "PRAGMA cache_size = -65536;"  # 64 MB
+    )
+    
+    def __init__(self, db_path: str):
+        self.db_path = str(db_path)
+        self._local = threading.local()
+        self._wal_checked = False
+    
+    @classmethod
+    def for_path(cls, db_path) -> "ConnectionPool":
+        """Get the shared pool for a database file, creating it on first use."""
+        key = str(db_path)
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None:
+                pool = cls._pools[key] = cls(key)
+            return pool
+    
+    @classmethod
+    def close_all(cls):
+        """Close the pooled connections of every database.
+        
+        Needed before the database files are deleted, since open connections
+        keep them locked on Windows.
+        """
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+        for pool in pools:
+            pool.close()
+    
+    def connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it if needed."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Room for every distinct query the managers issue, so each is only
+            # prepared once per connection
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            conn.row_factory = sqlite3.Row  # Enable column access by name
+            if not self._wal_checked:
+                # The journal mode is stored in the database file, so it only
+                # needs switching once
+                mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+                if mode.lower() != "wal":
+                    conn.execute("PRAGMA journal_mode = WAL")
+                self._wal_checked = True
+            conn.executescript(self._CONNECTION_PRAGMAS)
+            self._local.conn = conn
+        return conn
+    
+    def close(self):
+        """Close the calling thread's connection and drop the others.
+        
+        Connections held for other threads are released along with the old
+        thread-local storage and closed when they are garbage collected.
+        """
+        conn = getattr(self._local, 'conn', None)
+        self._local = threading.local()
+        if conn is not None:
+            conn.close()
+
+
 class ScannedROMsManager:
     """Manages persistent storage of scanned ROM data."""
     
@@ -22,6 +101,7 @@ class ScannedROMsManager:
             db_path: Path to the SQLite database
         """
         self.db_path = Path(db_path)
+        self._pool = ConnectionPool.for_path(self.db_path)
         self._init_database()
     
     def _init_database(self):
@@ -58,19 +138,26 @@ class ScannedROMsManager:
                 pass
             
             # Create indexes for better performance
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_scanned_roms_system_id ON scanned_roms(system_id)
-            """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_scanned_roms_status ON scanned_roms(status)
             """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_scanned_roms_crc32 ON scanned_roms(calculated_crc32)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_scanned_roms_sys_crc ON scanned_roms(system_id, calculated_crc32)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_scanned_roms_sys_status_crc ON scanned_roms(system_id, status, calculated_crc32)
+            """)
+            # Superseded by the composite indexes above, and each index adds
+            # to the cost of every row a scan writes
+            cursor.execute("DROP INDEX IF EXISTS idx_scanned_roms_system_id")
+            cursor.execute("DROP INDEX IF EXISTS idx_scanned_roms_sys_status")
             
             conn.commit()
 
-    def update_rom_status(self, system_id: int, new_status: ROMStatus, file_path: Optional[str] = None, crc32: Optional[str] = None, original_status: Optional[ROMStatus] = None):
+    def update_rom_status(self, system_id: int, new_status: ROMStatus, file_path: Optional[str] = None, crc32: Optional[str] = None, original_status: Optional[ROMStatus] = None, conn: Optional[sqlite3.Connection] = None, returning: bool = False):
         """Update the status of a specific ROM file using file_path or crc32.
 
         Args:
@@ -79,52 +166,74 @@ class ScannedROMsManager:
             file_path: Path to the ROM file (optional)
             crc32: CRC32 of the ROM file (optional)
             original_status: The original status before changing to ignored (optional)
+            conn: Connection to run on, left uncommitted for the caller (optional)
+            returning: Return the updated rows' status and original_status
+                instead of the row count, saving a read back (optional).
+                Needs SQLite 3.35 or newer.
+                
+        Returns:
+            Number of rows updated, or the updated rows if returning is set
         """
         print(f"update_rom_status: Called with system_id={system_id}, new_status={new_status}, file_path={file_path}, crc32={crc32}")
         if not file_path and not crc32:
             print("update_rom_status: Error - Either file_path or crc32 must be provided")
             raise ValueError("Either file_path or crc32 must be provided")
 
+        # One fixed statement per key column, so each is prepared once and
+        # reused from the statement cache. A NULL original_status leaves the
+        # stored one unchanged.
+        if file_path:
+            query = """
+                UPDATE scanned_roms
+                SET status = ?, original_status = COALESCE(?, original_status)
+                WHERE system_id = ? AND file_path = ?
+            """
+            params = (new_status.value, original_status.value if original_status else None, system_id, file_path)
+            print(f"update_rom_status: Executing query by file_path: {query} with params: {params}")
+        else:
+            query = """
+                UPDATE scanned_roms
+                SET status = ?, original_status = COALESCE(?, original_status)
+                WHERE system_id = ? AND calculated_crc32 = ?
+            """
+            params = (new_status.value, original_status.value if original_status else None, system_id, crc32)
+            print(f"update_rom_status: Executing query by crc32: {query} with params: {params}")
+        if returning:
+            query += "RETURNING status, original_status"
+        
+        with self._connection_for(conn) as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            if returning:
+                # The rows have to be read before the statement completes
+                rows = [dict(row) for row in cursor.fetchall()]
+                print(f"update_rom_status: Rows affected: {len(rows)}")
+                return rows
+            print(f"update_rom_status: Rows affected: {cursor.rowcount}")
+            return cursor.rowcount
+
+    def update_rom_statuses_bulk(self, rows: Iterable[Tuple[int, ROMStatus, str, Optional[ROMStatus]]]) -> int:
+        """Update the status of several ROMs, identified by crc32, in one transaction.
+
+        Args:
+            rows: (system_id, new_status, crc32, original_status) tuples. An
+                original_status of None leaves the stored original status unchanged.
+
+        Returns:
+            Number of rows updated
+        """
+        params = [
+            (new_status.value, original_status.value if original_status else None, system_id, crc32)
+            for system_id, new_status, crc32, original_status in rows
+        ]
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            if file_path:
-                if original_status:
-                    query = """
-                        UPDATE scanned_roms
-                        SET status = ?, original_status = ?
-                        WHERE system_id = ? AND file_path = ?
-                    """
-                    print(f"update_rom_status: Executing query by file_path: {query} with params: ({new_status.value}, {original_status.value}, {system_id}, {file_path})")
-                    cursor.execute(query, (new_status.value, original_status.value, system_id, file_path))
-                else:
-                    query = """
-                        UPDATE scanned_roms
-                        SET status = ?
-                        WHERE system_id = ? AND file_path = ?
-                    """
-                    print(f"update_rom_status: Executing query by file_path: {query} with params: ({new_status.value}, {system_id}, {file_path})")
-                    cursor.execute(query, (new_status.value, system_id, file_path))
-                print(f"update_rom_status: Rows affected: {cursor.rowcount}")
-            elif crc32:
-                if original_status:
-                    query = """
-                        UPDATE scanned_roms
-                        SET status = ?, original_status = ?
-                        WHERE system_id = ? AND calculated_crc32 = ?
-                    """
-                    print(f"update_rom_status: Executing query by crc32: {query} with params: ({new_status.value}, {original_status.value}, {system_id}, {crc32})")
-                    cursor.execute(query, (new_status.value, original_status.value, system_id, crc32))
-                else:
-                    query = """
-                        UPDATE scanned_roms
-                        SET status = ?
-                        WHERE system_id = ? AND calculated_crc32 = ?
-                    """
-                    print(f"update_rom_status: Executing query by crc32: {query} with params: ({new_status.value}, {system_id}, {crc32})")
-                    cursor.execute(query, (new_status.value, system_id, crc32))
-                print(f"update_rom_status: Rows affected: {cursor.rowcount}")
+            cursor.executemany("""
+                UPDATE scanned_roms
+                SET status = ?, original_status = COALESCE(?, original_status)
+                WHERE system_id = ? AND calculated_crc32 = ?
+            """, params)
             conn.commit()
-            print(f"update_rom_status: Changes committed to database")
             return cursor.rowcount
 
     def update_rom_path(self, system_id: int, old_file_path: str, new_file_path: str):
@@ -144,14 +253,27 @@ class ScannedROMsManager:
             """, (new_file_path, system_id, old_file_path))
             conn.commit()
     
-    def add_rom(self, system_id: int, status: ROMStatus, file_path: Optional[str] = None, file_size: Optional[int] = None, crc32: Optional[str] = None, original_status: Optional[ROMStatus] = None):
-        """Add a new ROM entry, typically for missing or ignored ROMs."""
-        with self.get_connection() as conn:
+    def add_rom(self, system_id: int, status: ROMStatus, file_path: Optional[str] = None, file_size: Optional[int] = None, crc32: Optional[str] = None, original_status: Optional[ROMStatus] = None, conn: Optional[sqlite3.Connection] = None, returning: bool = False):
+        """Add a new ROM entry, typically for missing or ignored ROMs.
+        
+        If conn is given the insert runs on it and is left for the caller to commit.
+        
+        Args:
+            returning: Return the stored row, saving a read back (optional).
+                Needs SQLite 3.35 or newer.
+        
+        Returns:
+            The stored ROM record, as written, if returning is set
+        """
+        query = """
+            INSERT INTO scanned_roms (system_id, file_path, file_size, calculated_crc32, status, original_status)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """
+        if returning:
+            query += "RETURNING *"
+        
+        with self._connection_for(conn) as conn:
             cursor = conn.cursor()
-            query = """
-                INSERT INTO scanned_roms (system_id, file_path, file_size, calculated_crc32, status, original_status)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """
             # Use placeholder for file_path if not provided, to satisfy NOT NULL constraint
             final_file_path = file_path if file_path is not None else f"missing_{crc32}"
             final_file_size = file_size if file_size is not None else 0
@@ -165,21 +287,75 @@ class ScannedROMsManager:
                 original_status.value if original_status else None
             )
             cursor.execute(query, params)
-            conn.commit()
+            if returning:
+                return dict(cursor.fetchall()[0])
 
+    def add_roms(self, rows: Iterable[Dict[str, Any]], conn: Optional[sqlite3.Connection] = None) -> int:
+        """Add or replace several ROM entries in one transaction.
+        
+        Args:
+            rows: Dicts with the add_rom arguments: system_id and status, and
+                optionally file_path, file_size, crc32 and original_status
+            conn: Connection to run on, left uncommitted for the caller (optional)
+            
+        Returns:
+            Number of rows written
+        """
+        params = [
+            (
+                row['system_id'],
+                row.get('file_path') if row.get('file_path') is not None else f"missing_{row.get('crc32')}",
+                row.get('file_size') if row.get('file_size') is not None else 0,
+                row.get('crc32'),
+                row['status'].value,
+                row['original_status'].value if row.get('original_status') else None
+            )
+            for row in rows
+        ]
+        with self._connection_for(conn) as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT OR REPLACE INTO scanned_roms (system_id, file_path, file_size, calculated_crc32, status, original_status)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, params)
+            return cursor.rowcount
+    
     @contextmanager
     def get_connection(self):
-        """Get database connection with automatic cleanup.
+        """Get this thread's pooled database connection.
+        
+        Anything the block leaves uncommitted is rolled back when it exits,
+        as it would be if the connection were closed. A transaction that was
+        already open on entry belongs to an outer caller and is left alone.
         
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Enable column access by name
+        conn = self._pool.connection()
+        outer_transaction = conn.in_transaction
         try:
             yield conn
         finally:
-            conn.close()
+            if conn.in_transaction and not outer_transaction:
+                conn.rollback()
+    
+    @contextmanager
+    def _connection_for(self, conn: Optional[sqlite3.Connection] = None, commit: bool = True):
+        """Yield the caller's connection, or a pooled one committed on exit.
+        
+        A connection passed in by the caller is used as is and left for the
+        caller to commit or roll back. The pooled connection is shared with
+        anything else on this thread, so it is only committed when it was not
+        already in a transaction on entry, and never when commit is False.
+        """
+        if conn is not None:
+            yield conn
+            return
+        with self.get_connection() as own_conn:
+            outer_transaction = own_conn.in_transaction
+            yield own_conn
+            if commit and not outer_transaction:
+                own_conn.commit()
     
     def clear_system_scans(self, system_id: int):
         """Clear all scanned ROM data for a specific system.
@@ -258,17 +434,18 @@ class ScannedROMsManager:
 
             conn.commit()
     
-    def get_scanned_roms_by_status(self, system_id: int, status: ROMStatus) -> List[Dict[str, Any]]:
+    def get_scanned_roms_by_status(self, system_id: int, status: ROMStatus, conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
         """Get scanned ROMs by status for a specific system.
         
         Args:
             system_id: ID of the system
             status: ROM status to filter by
+            conn: Connection to read through, e.g. to see its uncommitted changes (optional)
             
         Returns:
             List of scanned ROM records
         """
-        with self.get_connection() as conn:
+        with self._connection_for(conn, commit=False) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT sr.*, g.major_name, g.region, g.languages, g.dat_rom_name
@@ -280,6 +457,26 @@ class ScannedROMsManager:
             
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_crc32_set_by_status(self, system_id: int, status: ROMStatus) -> Set[str]:
+        """Get the CRC32s of a system's scanned ROMs with the given status.
+        
+        Cheaper than get_scanned_roms_by_status when only membership matters,
+        since no game data is joined and no per-row dicts are built.
+        
+        Args:
+            system_id: ID of the system
+            status: ROM status to filter by
+            
+        Returns:
+            Set of CRC32 values
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT calculated_crc32 FROM scanned_roms
+                WHERE system_id = ? AND status = ? AND calculated_crc32 IS NOT NULL
+            """, (system_id, status.value))
+            return {row[0] for row in cursor}
+
     def get_rom_by_file_path(self, system_id: int, file_path: str) -> Optional[Dict[str, Any]]:
         """Get a single ROM record by its file_path."""
         with self.get_connection() as conn:
@@ -341,16 +538,15 @@ class ScannedROMsManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Create placeholders for the IN clause
-            placeholders = ','.join('?' * len(visible_game_crcs))
-            
-            cursor.execute(f"""
+            # The CRCs are bound as one JSON array so the SQL text stays the same
+            # for any number of them and its prepared statement is reused
+            cursor.execute("""
                 SELECT sr.*, g.major_name, g.region, g.languages, g.dat_rom_name
                 FROM scanned_roms sr
                 INNER JOIN games g ON sr.matched_game_id = g.id
-                WHERE sr.system_id = ? AND g.crc32 IN ({placeholders})
+                WHERE sr.system_id = ? AND g.crc32 IN (SELECT value FROM json_each(?))
                 ORDER BY sr.file_path
-            """, [system_id] + list(visible_game_crcs))
+            """, (system_id, json.dumps(list(visible_game_crcs))))
             
             return [dict(row) for row in cursor.fetchall()]
     
@@ -479,6 +675,48 @@ class ScannedROMsManager:
             
             return summary
     
+    def get_rom_status(self, system_id: int, crc32: str) -> Optional[ROMStatus]:
+        """Get the current status of a ROM.
+        
+        Args:
+            system_id: ID of the system
+            crc32: CRC32 of the ROM
+            
+        Returns:
+            The ROMStatus if found, None otherwise
+        """
+        with self.get_connection() as conn:
+            row = conn.execute("""
+                SELECT status FROM scanned_roms
+                WHERE system_id = ? AND calculated_crc32 = ?
+            """, (system_id, crc32)).fetchone()
+            
+            if row and row['status']:
+                try:
+                    return ROMStatus(row['status'])
+                except ValueError:
+                    return None
+            return None
+    
+    def has_rom_with_status(self, system_id: int, crc32: str, status: ROMStatus) -> bool:
+        """Check whether a ROM with the given CRC32 has the given status.
+        
+        Args:
+            system_id: ID of the system
+            crc32: CRC32 of the ROM
+            status: ROM status to look for
+            
+        Returns:
+            True if a matching ROM exists, False otherwise
+        """
+        with self.get_connection() as conn:
+            row = conn.execute("""
+                SELECT 1 FROM scanned_roms
+                WHERE system_id = ? AND calculated_crc32 = ? AND status = ?
+                LIMIT 1
+            """, (system_id, crc32, status.value)).fetchone()
+            return row is not None
+    
     def get_rom_original_status(self, system_id: int, crc32: str) -> Optional[ROMStatus]:
         """Get the original status of a ROM before it was ignored.
         
@@ -7,8 +7,9 @@ Handles loading and saving user settings from/to JSON configuration file.
 
 import json
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 
 class SettingsManager:
     """Manages application settings and configuration."""
@@ -26,6 +27,11 @@ class SettingsManager:
             self.config_file = app_data / "config.json"
         else:
             self.config_file = Path(config_file)
+        
+        # Set while inside batched() so intermediate saves are deferred
+        self._suspend_save = False
+        # system_id -> (stored CRC list, frozenset of it) for get_ignored_crcs_set
+        self._ignored_crcs_sets = {}
             
         self.settings = self._load_default_settings()
         self.load_settings()
@@ -93,14 +99,54 @@ class SettingsManager:
     
     def save_settings(self) -> None:
         """Save current settings to configuration file."""
+        if self._suspend_save:
+            return
+        
+        # Write a temporary file and swap it in, so a crash mid-write never
+        # leaves a truncated config behind
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
         try:
             # Ensure the config directory exists
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4, ensure_ascii=False)
+            # Serialize up front so the file is written in a single call
+            data = json.dumps(self.settings, indent=4, ensure_ascii=False)
+            with open(tmp_file, 'w', encoding='utf-8', buffering=65536) as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            if os.name != 'nt':
+                # Make the rename itself durable; Windows can't open directories
+                dir_fd = os.open(self.config_file.parent, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
         except Exception as e:
             print(f"Error saving settings: {e}")
+            # Don't leave a partial write behind; it's gone already if the rename happened
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+    
+    @contextmanager
+    def batched(self):
+        """Defer saves until the block exits, then write the settings once.
+        
+        Nested blocks are folded into the outermost one.
+        """
+        if self._suspend_save:
+            yield self
+            return
+        
+        self._suspend_save = True
+        try:
+            yield self
+        finally:
+            self._suspend_save = False
+            self.save_settings()
     
     def get_system_filter_settings(self, system_id: str) -> dict:
         """Get filter settings for a specific system."""
@@ -121,14 +167,71 @@ class SettingsManager:
                 return system_ignores
         return self.get("ignored_crcs", [])
 
+    def get_ignored_crcs_set(self, system_id: Optional[str] = None) -> frozenset:
+        """Get the ignored CRCs as a frozenset for membership tests.
+        
+        The set is reused until set_ignored_crcs() is called or the stored
+        list is replaced.
+        """
+        crc_list = self.get_ignored_crcs(system_id)
+        cached = self._ignored_crcs_sets.get(system_id)
+        if cached is not None and cached[0] is crc_list:
+            return cached[1]
+        crc_set = frozenset(crc_list)
+        self._ignored_crcs_sets[system_id] = (crc_list, crc_set)
+        return crc_set
+
     def set_ignored_crcs(self, crc_list: list, system_id: Optional[str] = None) -> None:
         """Set the list of ignored CRCs, optionally for a specific system."""
+        # A system's list can fall back to the global one, so drop every cached set
+        self._ignored_crcs_sets.clear()
         if system_id:
             self.set(f"system_ignored_crcs.{system_id}", crc_list)
         else:
             self.set("ignored_crcs", crc_list)
         self.save_settings()  # Save settings after modification.get("filter_settings", {}).copy()
     
+    def mutate_ignored_crcs(self, system_id: Optional[str] = None, add: Iterable[str] = (),
+                            remove: Iterable[str] = ()) -> list:
+        """Add and remove ignored CRCs, saving the settings at most once.
+        
+        Args:
+            system_id: System whose list to change (optional, global list if omitted)
+            add: CRCs to append if not already ignored
+            remove: CRCs to drop from the list
+            
+        Returns:
+            The resulting list of ignored CRCs
+        """
+        current = self.get_ignored_crcs(system_id)
+        remove = set(remove)
+        crc_list = [crc for crc in current if crc not in remove]
+        seen = set(crc_list)
+        for crc in add:
+            if crc not in seen:
+                seen.add(crc)
+                crc_list.append(crc)
+        if crc_list != current:
+            self.set_ignored_crcs(crc_list, system_id)
+        return crc_list
+    
+    @contextmanager
+    def edit_ignored_crcs(self, system_id: Optional[str] = None):
+        """Edit the ignored CRCs as a set, saving once when the block exits.
+        
+        Nothing is saved if the block raises or leaves the set unchanged.
+        
+        Args:
+            system_id: System whose list to change (optional, global list if omitted)
+            
+        Yields:
+            set: The ignored CRCs, to be modified in place
+        """
+        original = set(self.get_ignored_crcs(system_id))
+        crcs = set(original)
+        yield crcs
+        self.mutate_ignored_crcs(system_id, add=sorted(crcs - original), remove=original - crcs)
+    
     def set_system_filter_settings(self, system_id: str, filter_settings: dict) -> None:
         """Set filter settings for a specific system."""
         if "system_filter_settings" not in self.settings:
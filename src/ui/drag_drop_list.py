@@ -117,7 +117,7 @@ class DragDropListWidget(QListWidget):
         # Draw drop indicator line
         if self.drag_indicator_position >= 0:
             painter = QPainter(self.viewport())
-            painter.setPen(QPen(QColor(self.theme.colors['drag_drop']['highlight_border']), 2))
+            painter.setPen(QPen(QColor(self.theme.c.drag_drop_highlight_border), 2))
             
             if self.drag_indicator_position < self.count():
                 rect = self.visualItemRect(self.item(self.drag_indicator_position))
@@ -49,7 +49,7 @@ from core.scanned_roms_manager import ScannedROMsManager
 from ui.settings_dialog import SettingsDialog
 from ui.progress_dialog import ProgressDialog
 from ui.drag_drop_list import DragDropListWidget, RegionFilterWidget
-from ui.theme import Theme
+from ui.theme import get_default_theme
 
 class DATImportThread(QThread):
     """Thread for importing DAT files."""
@@ -133,7 +133,7 @@ class MainWindow(QMainWindow):
         self.ignored_crcs = set()  # Initialize as an empty set
         
         # Initialize theme
-        self.theme = Theme()
+        self.theme = get_default_theme()
         self.apply_theme()
         print("Setting up UI...")
         self.setup_ui()
@@ -147,9 +147,9 @@ class MainWindow(QMainWindow):
         
     def apply_theme(self):
         """Apply the application theme."""
-        # Get stylesheet from theme and apply it
+        # The stylesheet is applied once on the QApplication (see main.py);
+        # setting it again here would make Qt re-parse it for this window
         self.qss = self.theme.get_stylesheet()
-        self.setStyleSheet(self.qss)
         # Get colors for backward compatibility
         self.colors = self.theme.get_colors()
     
@@ -194,25 +194,25 @@ class MainWindow(QMainWindow):
         # Action buttons
         self.open_folder_button = QPushButton("Open ROM Folder")
         self.open_folder_button.setIcon(qta.icon('fa5s.folder-open', color='#d6d6d6', scale_factor=0.8))
-        self.open_folder_button.setStyleSheet(self.theme.get_button_style("ScanButton"))
+        self.open_folder_button.setObjectName("scanButton")
         self.open_folder_button.clicked.connect(self.open_rom_folder)
         controls_layout.addWidget(self.open_folder_button)
         
         self.scan_button = QPushButton("Scan ROM Folder")
         self.scan_button.setIcon(qta.icon('fa5s.search', color='#d6d6d6', scale_factor=0.8))
-        self.scan_button.setStyleSheet(self.theme.get_button_style("ScanButton"))
+        self.scan_button.setObjectName("scanButton")
         self.scan_button.clicked.connect(lambda: self.scan_rom_folder(prompt_for_folder=True))
         controls_layout.addWidget(self.scan_button)
         
         self.import_dat_button = QPushButton("Import DAT Files")
         self.import_dat_button.setIcon(qta.icon('fa5s.file-import', color='#d6d6d6', scale_factor=0.8))
-        self.import_dat_button.setStyleSheet(self.theme.get_button_style("QMainButton"))
+        self.import_dat_button.setObjectName("mainButton")
         self.import_dat_button.clicked.connect(self.import_dat_files)
         controls_layout.addWidget(self.import_dat_button)
         
         self.clear_rom_data_button = QPushButton("Clear ROM Data")
         self.clear_rom_data_button.setIcon(qta.icon('fa5s.trash', color='#d6d6d6', scale_factor=0.8))
-        self.clear_rom_data_button.setStyleSheet(self.theme.get_button_style("ClearButton"))
+        self.clear_rom_data_button.setObjectName("clearButton")
         self.clear_rom_data_button.clicked.connect(self.clear_rom_data)
         controls_layout.addWidget(self.clear_rom_data_button)
         
@@ -540,6 +540,7 @@ class MainWindow(QMainWindow):
         if not self.current_system_id:
             return
 
+        newly_ignored = []
         for item in items:
             if original_status == ROMStatus.MISSING:
                 crc32 = item.text(4)  # CRC32 is in the fifth column for missing ROMs
@@ -552,11 +553,7 @@ class MainWindow(QMainWindow):
                 # Add to in-memory ignored_crcs set
                 if crc32:
                     self.ignored_crcs.add(crc32)
-                    # Update the settings manager with the new ignored CRC
-                    current_ignored = self.settings_manager.get_ignored_crcs(self.current_system_id)
-                    if crc32 not in current_ignored:
-                        current_ignored.append(crc32)
-                        self.settings_manager.set_ignored_crcs(current_ignored, self.current_system_id)
+                    newly_ignored.append(crc32)
             else:
                 # Get the full file path from stored data, fallback to displayed text
                 file_path = item.data(1, Qt.ItemDataRole.UserRole) or item.text(1)
@@ -572,11 +569,11 @@ class MainWindow(QMainWindow):
                 # Add to in-memory ignored_crcs set if we have the CRC32
                 if crc32:
                     self.ignored_crcs.add(crc32)
-                    # Update the settings manager with the new ignored CRC
-                    current_ignored = self.settings_manager.get_ignored_crcs(self.current_system_id)
-                    if crc32 not in current_ignored:
-                        current_ignored.append(crc32)
-                        self.settings_manager.set_ignored_crcs(current_ignored, self.current_system_id)
+                    newly_ignored.append(crc32)
+
+        # Update the settings manager with the new ignored CRCs, saving once
+        # for the whole selection
+        self.settings_manager.mutate_ignored_crcs(self.current_system_id, add=newly_ignored)
 
         # Refresh the ROM lists and stats
         self.update_rom_lists()
@@ -624,6 +621,7 @@ class MainWindow(QMainWindow):
         if not self.current_system_id:
             return
 
+        unignored = []
         for item in items:
             # Get the CRC32 value for this item
             crc32 = item.text(5)
@@ -631,12 +629,7 @@ class MainWindow(QMainWindow):
             # Remove from in-memory ignored_crcs set
             if crc32 and crc32 in self.ignored_crcs:
                 self.ignored_crcs.remove(crc32)
-                
-                # Update the settings manager by removing this CRC
-                current_ignored = self.settings_manager.get_ignored_crcs(self.current_system_id)
-                if crc32 in current_ignored:
-                    current_ignored.remove(crc32)
-                    self.settings_manager.set_ignored_crcs(current_ignored, self.current_system_id)
+                unignored.append(crc32)
             
             # Get the original status from the database to restore the ROM to its proper state
             original_status = self.scanned_roms_manager.get_rom_original_status(self.current_system_id, crc32)
@@ -682,6 +675,9 @@ class MainWindow(QMainWindow):
             for rom in missing_roms:
                 print(f"DEBUG: Missing ROM: CRC32={rom.get('calculated_crc32')}, status={rom.get('status')}")
 
+        # Remove the CRCs from the settings manager, saving once for the whole selection
+        self.settings_manager.mutate_ignored_crcs(self.current_system_id, remove=unignored)
+
         # Update the ignored_crcs attribute to reflect the changes
         self.ignored_crcs = set(self.settings_manager.get_ignored_crcs(self.current_system_id))
         
@@ -818,8 +814,10 @@ class MainWindow(QMainWindow):
         """Create the bottom panel with filters and actions."""
         panel = QWidget()
         panel.setObjectName("bottom_panel")
-        panel.setMaximumHeight(self.theme.dimensions['panel_maximum_height'])  # Limit height to prevent overlap
-        panel.setStyleSheet("background-color: transparent !important;")
+        panel.setMaximumHeight(self.theme.dimensions['main_window']['panel_maximum_height'])  # Limit height to prevent overlap
+        # Scoped by object name: a selector-less rule here would reach the
+        # buttons below and override the app's QPushButton#<objectName> rules
+        panel.setStyleSheet("QWidget#bottom_panel { background-color: transparent; }")
         layout = QHBoxLayout(panel)
         layout.setSpacing(10)
         
@@ -859,12 +857,14 @@ class MainWindow(QMainWindow):
         language_group = QGroupBox("Languages")
         language_group.setObjectName("language_group_box")
         language_scroll = QScrollArea()
-        language_scroll.setMaximumHeight(self.theme.dimensions['language_scroll_maximum_height'])
+        language_scroll.setObjectName("language_scroll")
+        language_scroll.setMaximumHeight(self.theme.dimensions['main_window']['language_scroll_maximum_height'])
         language_scroll.setWidgetResizable(True)
-        language_scroll.setStyleSheet("background-color: transparent;")
+        language_scroll.setStyleSheet("QScrollArea#language_scroll { background-color: transparent; }")
         language_scroll.setFrameShape(QFrame.Shape.NoFrame)  # Remove the frame border
         language_widget = QWidget()
-        language_widget.setStyleSheet("background-color: transparent;")
+        language_widget.setObjectName("language_widget")
+        language_widget.setStyleSheet("QWidget#language_widget { background-color: transparent; }")
         self.language_filter_layout = QVBoxLayout(language_widget)
         self.language_filter_layout.setSpacing(2)
         self.language_checkboxes = {}
@@ -877,11 +877,11 @@ class MainWindow(QMainWindow):
         lang_button_layout = QHBoxLayout()
         self.select_all_languages_button = QPushButton("Select All")
         self.select_all_languages_button.clicked.connect(self.select_all_languages)
-        self.select_all_languages_button.setStyleSheet(self.theme.get_button_style("SelectAllButton"))
+        self.select_all_languages_button.setObjectName("selectAllButton")
         
         self.clear_all_languages_button = QPushButton("Clear All")
         self.clear_all_languages_button.clicked.connect(self.clear_all_languages)
-        self.clear_all_languages_button.setStyleSheet(self.theme.get_button_style("ClearAllButton"))
+        self.clear_all_languages_button.setObjectName("clearAllButton")
         
         lang_button_layout.addWidget(self.select_all_languages_button)
         lang_button_layout.addWidget(self.clear_all_languages_button)
@@ -954,11 +954,11 @@ class MainWindow(QMainWindow):
         
         self.select_all_types_button = QPushButton("Select All")
         self.select_all_types_button.clicked.connect(self.select_all_game_types)
-        self.select_all_types_button.setStyleSheet(self.theme.get_button_style("SelectAllButton"))
+        self.select_all_types_button.setObjectName("selectAllButton")
         
         self.clear_all_types_button = QPushButton("Clear All")
         self.clear_all_types_button.clicked.connect(self.clear_all_game_types)
-        self.clear_all_types_button.setStyleSheet(self.theme.get_button_style("ClearAllButton"))
+        self.clear_all_types_button.setObjectName("clearAllButton")
         
         button_layout.addWidget(self.select_all_types_button)
         button_layout.addWidget(self.clear_all_types_button)
@@ -986,25 +986,25 @@ class MainWindow(QMainWindow):
         
         self.rename_button = QPushButton("Rename Wrong Filenames")
         self.rename_button.setIcon(qta.icon('fa5s.pen', color='#d6d6d6', scale_factor=0.8))
-        self.rename_button.setStyleSheet(self.theme.get_button_style("QMainButton"))
+        self.rename_button.setObjectName("mainButton")
         self.rename_button.clicked.connect(self.rename_wrong_filenames)
         actions_layout.addWidget(self.rename_button)
         
         self.move_extra_button = QPushButton("Move Extra Files")
         self.move_extra_button.setIcon(qta.icon('fa5s.folder-open', color='#d6d6d6', scale_factor=0.8))
-        self.move_extra_button.setStyleSheet(self.theme.get_button_style("QMainButton"))
+        self.move_extra_button.setObjectName("mainButton")
         self.move_extra_button.clicked.connect(self.move_extra_files)
         actions_layout.addWidget(self.move_extra_button)
         
         self.move_broken_button = QPushButton("Move Broken Files")
         self.move_broken_button.setIcon(qta.icon('fa5s.exclamation-triangle', color='#d6d6d6', scale_factor=0.8))
-        self.move_broken_button.setStyleSheet(self.theme.get_button_style("QMainButton"))
+        self.move_broken_button.setObjectName("mainButton")
         self.move_broken_button.clicked.connect(self.move_broken_files)
         actions_layout.addWidget(self.move_broken_button)
         
         self.export_missing_button = QPushButton("Export Missing List")
         self.export_missing_button.setIcon(qta.icon('fa5s.file-export', color='#d6d6d6', scale_factor=0.8))
-        self.export_missing_button.setStyleSheet(self.theme.get_button_style("QMainButton"))
+        self.export_missing_button.setObjectName("mainButton")
         self.export_missing_button.clicked.connect(self.export_missing_list)
         actions_layout.addWidget(self.export_missing_button)
         
@@ -1244,8 +1244,8 @@ class MainWindow(QMainWindow):
             
             # Color coding based on status
             if game['is_verified_dump']:
-                item.setBackground(0, QColor(self.theme.colors['tree_item_correct_bg']))  # Light green
-                item.setForeground(0, QColor(self.theme.colors['tree_item_correct_text']))  # Black text
+                item.setBackground(0, QColor(self.theme.c.tree_item_correct_bg))  # Light green
+                item.setForeground(0, QColor(self.theme.c.tree_item_correct_text))  # Black text
             
             self.dat_tree.addTopLevelItem(item)
         
@@ -61,14 +61,14 @@ class ProgressDialog(QDialog):
         button_layout = QHBoxLayout()
         
         self.show_log_button = QPushButton("Show Log")
-        self.show_log_button.setStyleSheet(self.theme.get_button_style("QMainButton"))
+        self.show_log_button.setObjectName("mainButton")
         self.show_log_button.clicked.connect(self.toggle_log)
         button_layout.addWidget(self.show_log_button)
         
         button_layout.addStretch()
         
         self.cancel_button = QPushButton("Cancel")
-        self.cancel_button.setStyleSheet(self.theme.get_button_style("QMainButton"))
+        self.cancel_button.setObjectName("mainButton")
         self.cancel_button.clicked.connect(self.cancel_operation)
         button_layout.addWidget(self.cancel_button)
         
@@ -6,24 +6,67 @@ Provides a user interface for configuring application settings.
 """
 
 import os
-import shutil
+import stat
+import sys
 from pathlib import Path
-from typing import Dict, Any
 
 import logging
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QGroupBox, QLabel, QLineEdit, QPushButton, QSpinBox,
     QCheckBox, QComboBox, QFileDialog, QDialogButtonBox,
-    QFormLayout, QSlider, QTextEdit, QMessageBox, QListWidget
+    QFormLayout, QSlider, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool
 import qtawesome as qta
 
 from core.settings_manager import SettingsManager
+from core.scanned_roms_manager import ConnectionPool
 from ui.drag_drop_list import DragDropListWidget
-from ui.theme import Theme
+from ui.theme import get_default_theme
+
+
+def _fast_rmtree(path):
+    """Recursively delete a directory tree using os.scandir.
+    
+    Read-only entries (common on Windows) are made writable and retried.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                try:
+                    os.unlink(entry.path)
+                except PermissionError:
+                    os.chmod(entry.path, stat.S_IWRITE)
+                    os.unlink(entry.path)
+    try:
+        os.rmdir(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE)
+        os.rmdir(path)
+
+
+class _DbTask(QRunnable):
+    """Runs a database call on the global thread pool."""
+    
+    class Signals(QObject):
+        finished = pyqtSignal(object)  # return value of the call
+        error = pyqtSignal(str)
+    
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = self.Signals()
+    
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
 
 class SettingsDialog(QDialog):
     """Settings configuration dialog."""
@@ -37,9 +80,19 @@ class SettingsDialog(QDialog):
         self.settings_manager = settings_manager
         self.temp_settings = settings_manager.get_all_settings().copy()
         
-        # Initialize theme
-        self.theme = Theme()
-        self.setStyleSheet(self.theme.get_stylesheet())
+        # Home directory is the fallback start location for the browse dialogs
+        self._home = str(Path.home())
+        
+        # Initialize theme; the application stylesheet is already set on QApplication
+        self.theme = get_default_theme()
+        
+        # Widget styles shared across the tabs, formatted once per dialog
+        self._styles = {
+            "group": self.theme.get_settings_transparent_group_box_style(),
+            "help": self.theme.get_settings_help_text_style(),
+            "warning": self.theme.get_settings_warning_button_style(),
+            "available_list": self.theme.get_drag_drop_available_list_style(),
+        }
         
         self.setup_ui()
         self.load_settings()
@@ -86,7 +139,7 @@ class SettingsDialog(QDialog):
         
         # Region Priority
         region_group = QGroupBox("Region Priority")
-        region_group.setStyleSheet(self.theme.get_settings_transparent_group_box_style())
+        region_group.setStyleSheet(self._styles["group"])
         region_layout = QVBoxLayout(region_group)
         
         region_help = QLabel(
@@ -94,13 +147,13 @@ class SettingsDialog(QDialog):
             "Used when multiple versions of the same game are available."
         )
         region_help.setWordWrap(True)
-        region_help.setStyleSheet(self.theme.get_settings_help_text_style())
+        region_help.setStyleSheet(self._styles["help"])
         region_layout.addWidget(region_help)
         
         self.region_priority_list = DragDropListWidget(self.theme)
         self.region_priority_list.setMaximumHeight(self.theme.get_dimension('settings_dialog', 'list_maximum_height'))
         # Apply correct styling for drag and drop list
-        available_style = self.theme.get_drag_drop_available_list_style()
+        available_style = self._styles["available_list"]
         self.region_priority_list.setStyleSheet(available_style)
         self.region_priority_list.set_original_style(available_style)
         region_layout.addWidget(self.region_priority_list)
@@ -109,22 +162,19 @@ class SettingsDialog(QDialog):
         region_buttons = QHBoxLayout()
         region_buttons.setSpacing(10)
         
-        # Get theme-based button styles
-        main_button_style = self.theme.get_button_style("QMainButton")
-        
         self.add_region_edit = QLineEdit()
         self.add_region_edit.setPlaceholderText("Add new region...")
         region_buttons.addWidget(self.add_region_edit)
         
         self.add_region_button = QPushButton("Add")
         self.add_region_button.setIcon(qta.icon('fa5s.plus', color='#d6d6d6', scale_factor=0.8))
-        self.add_region_button.setStyleSheet(main_button_style)
+        self.add_region_button.setObjectName("mainButton")
         self.add_region_button.clicked.connect(self.add_region)
         region_buttons.addWidget(self.add_region_button)
         
         self.remove_region_button = QPushButton("Remove")
         self.remove_region_button.setIcon(qta.icon('fa5s.minus', color='#d6d6d6', scale_factor=0.8))
-        self.remove_region_button.setStyleSheet(main_button_style)
+        self.remove_region_button.setObjectName("mainButton")
         self.remove_region_button.clicked.connect(self.remove_region)
         region_buttons.addWidget(self.remove_region_button)
         
@@ -133,7 +183,7 @@ class SettingsDialog(QDialog):
         
         # Language Priority
         language_group = QGroupBox("Language Priority")
-        language_group.setStyleSheet(self.theme.get_settings_transparent_group_box_style())
+        language_group.setStyleSheet(self._styles["group"])
         language_layout = QVBoxLayout(language_group)
         
         language_help = QLabel(
@@ -141,13 +191,13 @@ class SettingsDialog(QDialog):
             "Used when multiple language versions are available."
         )
         language_help.setWordWrap(True)
-        language_help.setStyleSheet(self.theme.get_settings_help_text_style())
+        language_help.setStyleSheet(self._styles["help"])
         language_layout.addWidget(language_help)
         
         self.language_priority_list = DragDropListWidget(self.theme)
         self.language_priority_list.setMaximumHeight(self.theme.get_dimension('settings_dialog', 'list_maximum_height'))
         # Apply correct styling for drag and drop list
-        available_style = self.theme.get_drag_drop_available_list_style()
+        available_style = self._styles["available_list"]
         self.language_priority_list.setStyleSheet(available_style)
         self.language_priority_list.set_original_style(available_style)
         language_layout.addWidget(self.language_priority_list)
@@ -162,13 +212,13 @@ class SettingsDialog(QDialog):
         
         self.add_language_button = QPushButton("Add")
         self.add_language_button.setIcon(qta.icon('fa5s.plus', color='#d6d6d6', scale_factor=0.8))
-        self.add_language_button.setStyleSheet(main_button_style)
+        self.add_language_button.setObjectName("mainButton")
         self.add_language_button.clicked.connect(self.add_language)
         language_buttons.addWidget(self.add_language_button)
         
         self.remove_language_button = QPushButton("Remove")
         self.remove_language_button.setIcon(qta.icon('fa5s.minus', color='#d6d6d6', scale_factor=0.8))
-        self.remove_language_button.setStyleSheet(main_button_style)
+        self.remove_language_button.setObjectName("mainButton")
         self.remove_language_button.clicked.connect(self.remove_language)
         language_buttons.addWidget(self.remove_language_button)
         
@@ -178,7 +228,7 @@ class SettingsDialog(QDialog):
         
         # Performance
         performance_group = QGroupBox("Performance")
-        performance_group.setStyleSheet(self.theme.get_settings_transparent_group_box_style())
+        performance_group.setStyleSheet(self._styles["group"])
         performance_layout = QFormLayout(performance_group)
         
         self.chunk_size_spin = QSpinBox()
@@ -191,7 +241,7 @@ class SettingsDialog(QDialog):
             "Larger values use more memory but may be faster."
         )
         chunk_help.setWordWrap(True)
-        chunk_help.setStyleSheet(self.theme.get_settings_help_text_style())
+        chunk_help.setStyleSheet(self._styles["help"])
         performance_layout.addRow(chunk_help)
         
         layout.addWidget(performance_group)
@@ -204,12 +254,9 @@ class SettingsDialog(QDialog):
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
-        # Define button styles for this tab
-        main_button_style = self.theme.get_button_style("QMainButton")
-        
         # DAT Files
         dat_group = QGroupBox("DAT Files")
-        dat_group.setStyleSheet(self.theme.get_settings_transparent_group_box_style())
+        dat_group.setStyleSheet(self._styles["group"])
         dat_layout = QFormLayout(dat_group)
         
         dat_row = QHBoxLayout()
@@ -219,7 +266,7 @@ class SettingsDialog(QDialog):
         
         self.dat_browse_button = QPushButton("Browse...")
         self.dat_browse_button.setIcon(qta.icon('fa5s.folder-open', color='#d6d6d6', scale_factor=0.8))
-        self.dat_browse_button.setStyleSheet(main_button_style)
+        self.dat_browse_button.setObjectName("mainButton")
         self.dat_browse_button.clicked.connect(self.browse_dat_folder)
         dat_row.addWidget(self.dat_browse_button)
         
@@ -230,14 +277,14 @@ class SettingsDialog(QDialog):
             "These files define the official ROM sets for each system."
         )
         dat_help.setWordWrap(True)
-        dat_help.setStyleSheet(self.theme.get_settings_help_text_style())
+        dat_help.setStyleSheet(self._styles["help"])
         dat_layout.addRow(dat_help)
         
         layout.addWidget(dat_group)
         
         # Output Folders
         output_group = QGroupBox("Output Folders")
-        output_group.setStyleSheet(self.theme.get_settings_transparent_group_box_style())
+        output_group.setStyleSheet(self._styles["group"])
         output_layout = QFormLayout(output_group)
         
         # Extra files folder
@@ -247,7 +294,7 @@ class SettingsDialog(QDialog):
         
         self.extra_browse_button = QPushButton("Browse...")
         self.extra_browse_button.setIcon(qta.icon('fa5s.folder-open', color='#d6d6d6', scale_factor=0.8))
-        self.extra_browse_button.setStyleSheet(main_button_style)
+        self.extra_browse_button.setObjectName("mainButton")
         self.extra_browse_button.clicked.connect(self.browse_extra_folder)
         extra_row.addWidget(self.extra_browse_button)
         
@@ -260,7 +307,7 @@ class SettingsDialog(QDialog):
         
         self.broken_browse_button = QPushButton("Browse...")
         self.broken_browse_button.setIcon(qta.icon('fa5s.folder-open', color='#d6d6d6', scale_factor=0.8))
-        self.broken_browse_button.setStyleSheet(main_button_style)
+        self.broken_browse_button.setObjectName("mainButton")
         self.broken_browse_button.clicked.connect(self.browse_broken_folder)
         broken_row.addWidget(self.broken_browse_button)
         
@@ -271,7 +318,7 @@ class SettingsDialog(QDialog):
             "Leave empty to create subfolders in the ROM directory."
         )
         output_help.setWordWrap(True)
-        output_help.setStyleSheet(self.theme.get_settings_help_text_style())
+        output_help.setStyleSheet(self._styles["help"])
         output_layout.addRow(output_help)
         
         layout.addWidget(output_group)
@@ -287,7 +334,7 @@ class SettingsDialog(QDialog):
         
         # Default Filter Settings
         filter_group = QGroupBox("Default Filter Settings")
-        filter_group.setStyleSheet(self.theme.get_settings_transparent_group_box_style())
+        filter_group.setStyleSheet(self._styles["group"])
         filter_layout = QVBoxLayout(filter_group)
         
         filter_help = QLabel(
@@ -295,7 +342,7 @@ class SettingsDialog(QDialog):
             "You can always change these filters in the main window."
         )
         filter_help.setWordWrap(True)
-        filter_help.setStyleSheet(self.theme.get_settings_help_text_style())
+        filter_help.setStyleSheet(self._styles["help"])
         filter_layout.addWidget(filter_help)
         
         # Checkboxes for each filter
@@ -324,7 +371,7 @@ class SettingsDialog(QDialog):
         
         # Duplicate Handling
         duplicate_group = QGroupBox("Duplicate Handling")
-        duplicate_group.setStyleSheet(self.theme.get_settings_transparent_group_box_style())
+        duplicate_group.setStyleSheet(self._styles["group"])
         duplicate_layout = QFormLayout(duplicate_group)
         
         self.duplicate_action_combo = QComboBox()
@@ -347,7 +394,7 @@ class SettingsDialog(QDialog):
         
         # File Operations
         file_ops_group = QGroupBox("File Operations")
-        file_ops_group.setStyleSheet(self.theme.get_settings_transparent_group_box_style())
+        file_ops_group.setStyleSheet(self._styles["group"])
         file_ops_layout = QVBoxLayout(file_ops_group)
         
         self.backup_before_rename_cb = QCheckBox("Create backup before renaming files")
@@ -360,7 +407,7 @@ class SettingsDialog(QDialog):
         
         # Matching Algorithm
         matching_group = QGroupBox("Matching Algorithm")
-        matching_group.setStyleSheet(self.theme.get_settings_transparent_group_box_style())
+        matching_group.setStyleSheet(self._styles["group"])
         matching_layout = QFormLayout(matching_group)
         
         self.similarity_threshold_slider = QSlider(Qt.Orientation.Horizontal)
@@ -380,14 +427,14 @@ class SettingsDialog(QDialog):
             "Lower values find more matches but may include false positives."
         )
         threshold_help.setWordWrap(True)
-        threshold_help.setStyleSheet(self.theme.get_settings_help_text_style())
+        threshold_help.setStyleSheet(self._styles["help"])
         matching_layout.addRow(threshold_help)
         
         layout.addWidget(matching_group)
         
         # Debug Options
         debug_group = QGroupBox("Debug Options")
-        debug_group.setStyleSheet(self.theme.get_settings_transparent_group_box_style())
+        debug_group.setStyleSheet(self._styles["group"])
         debug_layout = QVBoxLayout(debug_group)
         
         self.enable_debug_logging_cb = QCheckBox("Enable debug logging")
@@ -403,7 +450,7 @@ class SettingsDialog(QDialog):
     
     def browse_dat_folder(self):
         """Browse for DAT folder."""
-        current = self.dat_folder_edit.text() or str(Path.home())
+        current = self.dat_folder_edit.text() or self._home
         folder = QFileDialog.getExistingDirectory(self, "Select DAT Folder", current)
         if folder:
             self.dat_folder_edit.setText(folder)
@@ -411,7 +458,7 @@ class SettingsDialog(QDialog):
     
     def browse_extra_folder(self):
         """Browse for extra files folder."""
-        current = self.extra_folder_edit.text() or str(Path.home())
+        current = self.extra_folder_edit.text() or self._home
         folder = QFileDialog.getExistingDirectory(self, "Select Extra Files Folder", current)
         if folder:
             self.extra_folder_edit.setText(folder)
@@ -419,7 +466,7 @@ class SettingsDialog(QDialog):
     
     def browse_broken_folder(self):
         """Browse for broken files folder."""
-        current = self.broken_folder_edit.text() or str(Path.home())
+        current = self.broken_folder_edit.text() or self._home
         folder = QFileDialog.getExistingDirectory(self, "Select Broken Files Folder", current)
         if folder:
             self.broken_folder_edit.setText(folder)
@@ -437,7 +484,6 @@ class SettingsDialog(QDialog):
     def update_similarity_label(self, value: int):
         """Update similarity threshold label."""
         self.similarity_label.setText(f"{value}%")
-        self.temp_settings['similarity_threshold'] = value / 100.0
     
     def load_settings(self):
         """Load current settings into the UI."""
@@ -640,7 +686,7 @@ class SettingsDialog(QDialog):
             "of any important data before proceeding."
         )
         warning_text.setWordWrap(True)
-        warning_text.setStyleSheet(self.theme.get_settings_warning_button_style())
+        warning_text.setStyleSheet(self._styles["warning"])
         warning_layout.addWidget(warning_text)
         
         # Reset buttons with improved styling
@@ -658,12 +704,12 @@ class SettingsDialog(QDialog):
             "ROM files in your ROM folders will NOT be deleted."
         )
         reset_program_desc.setWordWrap(True)
-        reset_program_desc.setStyleSheet(self.theme.get_settings_help_text_style())
+        reset_program_desc.setStyleSheet(self._styles["help"])
         warning_layout.addWidget(reset_program_desc)
         
         # System selection for partial reset
         system_reset_group = QGroupBox("Remove Specific System")
-        system_reset_group.setStyleSheet(self.theme.get_settings_transparent_group_box_style())
+        system_reset_group.setStyleSheet(self._styles["group"])
         system_reset_layout = QVBoxLayout(system_reset_group)
         system_reset_layout.setSpacing(10)
         
@@ -686,7 +732,7 @@ class SettingsDialog(QDialog):
         # Remove system button
         remove_system_btn = QPushButton("Remove Selected System")
         remove_system_btn.setIcon(qta.icon('fa5s.trash', color='#d6d6d6', scale_factor=0.8))
-        remove_system_btn.setStyleSheet(self.theme.get_settings_warning_button_style())
+        remove_system_btn.setStyleSheet(self._styles["warning"])
         remove_system_btn.clicked.connect(self.remove_selected_system)
         system_reset_layout.addWidget(remove_system_btn)
         
@@ -695,7 +741,7 @@ class SettingsDialog(QDialog):
             "ROM files will NOT be deleted."
         )
         remove_system_desc.setWordWrap(True)
-        remove_system_desc.setStyleSheet(self.theme.get_settings_help_text_style())
+        remove_system_desc.setStyleSheet(self._styles["help"])
         system_reset_layout.addWidget(remove_system_desc)
         
         warning_layout.addWidget(system_reset_group)
@@ -707,16 +753,45 @@ class SettingsDialog(QDialog):
     def populate_system_combo(self):
         """Populate the system combo box with available systems."""
         self.system_combo.clear()
-        self.system_combo.addItem("Select a system...", None)
         
         # Get database manager from settings manager if available
-        if hasattr(self.settings_manager, 'db_manager'):
-            try:
-                systems = self.settings_manager.db_manager.get_all_systems()
-                for system in systems:
-                    self.system_combo.addItem(system['system_name'], system['id'])
-            except Exception as e:
-                logging.error(f"Error loading systems: {e}")
+        if not hasattr(self.settings_manager, 'db_manager'):
+            self.system_combo.addItem("Select a system...", None)
+            return
+        
+        # Query systems off the UI thread; the combo is filled when they arrive
+        self.system_combo.addItem("Loading…", None)
+        task = _DbTask(self.settings_manager.db_manager.get_all_systems)
+        task.signals.finished.connect(self._on_systems_loaded)
+        task.signals.error.connect(self._on_systems_load_failed)
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_systems_loaded(self, systems):
+        """Fill the system combo box with the loaded systems."""
+        names = ["Select a system..."] + [system['system_name'] for system in systems]
+        ids = [None] + [system['id'] for system in systems]
+        
+        # Insert all rows in one go rather than relaying out the view per item
+        model = self.system_combo.model()
+        self.system_combo.setUpdatesEnabled(False)
+        model.blockSignals(True)
+        try:
+            self.system_combo.clear()
+            self.system_combo.addItems(names)
+            for index, system_id in enumerate(ids):
+                self.system_combo.setItemData(index, system_id)
+        finally:
+            model.blockSignals(False)
+            model.layoutChanged.emit()
+            self.system_combo.setUpdatesEnabled(True)
+        # The combo missed the row-insert signals, so select the placeholder explicitly
+        self.system_combo.setCurrentIndex(0)
+    
+    def _on_systems_load_failed(self, message: str):
+        """Reset the system combo box after a failed load."""
+        self.system_combo.clear()
+        self.system_combo.addItem("Select a system...", None)
+        logging.error(f"Error loading systems: {message}")
     
     def reset_entire_program(self):
         """Reset the entire program - database, settings, and cache."""
@@ -738,27 +813,19 @@ class SettingsDialog(QDialog):
             errors = []
             
             try:
-                # Clear all ignored CRCs from settings before deletion
-                self.settings_manager.set("ignored_crcs", [])
-                # Clear all system-specific ignored CRCs
-                if "system_ignored_crcs" in self.settings_manager.settings:
-                    self.settings_manager.settings["system_ignored_crcs"] = {}
-                # Clear all system-specific filter settings
-                if "system_filter_settings" in self.settings_manager.settings:
-                    self.settings_manager.settings["system_filter_settings"] = {}
-                # Clear global filter settings that serve as defaults
-                if "filter_settings" in self.settings_manager.settings:
-                    self.settings_manager.settings["filter_settings"] = {}
-                
-                if not self.settings_manager.save_settings():
-                    errors.append("Failed to save cleared settings during reset.")
-                
-                # Force garbage collection to release any database file handles
-                # The DatabaseManager uses context managers so connections are auto-closed
-                
-                # Force garbage collection to release any file handles
-                import gc
-                gc.collect()
+                # Clear settings before deletion, written out once on exit
+                with self.settings_manager.batched() as settings_manager:
+                    # Clear all ignored CRCs from settings before deletion
+                    settings_manager.set("ignored_crcs", [])
+                    # Clear all system-specific ignored CRCs
+                    if "system_ignored_crcs" in settings_manager.settings:
+                        settings_manager.settings["system_ignored_crcs"] = {}
+                    # Clear all system-specific filter settings
+                    if "system_filter_settings" in settings_manager.settings:
+                        settings_manager.settings["system_filter_settings"] = {}
+                    # Clear global filter settings that serve as defaults
+                    if "filter_settings" in settings_manager.settings:
+                        settings_manager.settings["filter_settings"] = {}
                 
                 # Get paths before attempting deletion
                 app_data = Path.home() / ".romplestiltskin"
@@ -771,41 +838,31 @@ class SettingsDialog(QDialog):
                 config_path = self.settings_manager.config_file
                 
                 # Try to delete individual files first
-                if db_path and db_path.exists():
-                    try:
-                        db_path.unlink()
-                        if db_path.exists():
-                            errors.append(f"Database file still exists: {db_path}")
-                    except Exception as e:
-                        errors.append(f"Could not delete database: {e}")
+                # Pooled scanned-ROM connections stay open between queries
+                ConnectionPool.close_all()
+                if db_path and sys.platform == "win32":
+                    # DatabaseManager closes its connections on exit, but Windows
+                    # can hold the file open until stray references are collected
+                    import gc
+                    gc.collect()
                 
-                if config_path and config_path.exists():
+                for label, path in (("database", db_path), ("config", config_path)):
+                    if path is None:
+                        continue
                     try:
-                        config_path.unlink()
-                        if config_path.exists():
-                            errors.append(f"Config file still exists: {config_path}")
-                    except Exception as e:
-                        errors.append(f"Could not delete config: {e}")
+                        path.unlink(missing_ok=True)
+                    except OSError as e:
+                        errors.append(f"Could not delete {label}: {e}")
                 
                 # Try to remove the entire directory as a fallback
                 if app_data.exists():
                     try:
-                        shutil.rmtree(app_data, ignore_errors=True)
-                        # Verify deletion
-                        if app_data.exists():
-                            # Try force deletion on Windows
-                            import os
-                            import stat
-                            def handle_remove_readonly(func, path, exc):
-                                os.chmod(path, stat.S_IWRITE)
-                                func(path)
-                            
-                            shutil.rmtree(app_data, onerror=handle_remove_readonly)
-                            
-                            if app_data.exists():
-                                errors.append(f"Could not completely remove directory: {app_data}")
+                        _fast_rmtree(app_data)
                     except Exception as e:
                         errors.append(f"Could not remove app data directory: {e}")
+                    
+                    if app_data.exists():
+                        errors.append(f"Could not completely remove directory: {app_data}")
                 
                 if errors:
                     error_msg = "Reset completed with warnings:\n\n" + "\n".join(errors)
@@ -861,26 +918,38 @@ class SettingsDialog(QDialog):
             QMessageBox.StandardButton.No
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                if hasattr(self.settings_manager, 'db_manager'):
-                    self.settings_manager.db_manager.delete_system(system_id)
-                    
-                    # Emit signal that system was removed
-                    self.system_removed.emit(system_id)
-                    
-                    QMessageBox.information(
-                        self,
-                        "System Removed",
-                        f"System '{system_name}' has been removed successfully."
-                    )
-                    
-                    # Refresh the combo box
-                    self.populate_system_combo()
-                    
-            except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "Remove Failed",
-                    f"Failed to remove system: {str(e)}"
-                )
\ No newline at end of file
+        if reply == QMessageBox.StandardButton.Yes and hasattr(self.settings_manager, 'db_manager'):
+            db_manager = self.settings_manager.db_manager
+            
+            def remove():
+                db_manager.delete_system(system_id)
+                return system_id, system_name
+            
+            task = _DbTask(remove)
+            task.signals.finished.connect(self._on_system_removed)
+            task.signals.error.connect(self._on_system_remove_failed)
+            QThreadPool.globalInstance().start(task)
+    
+    def _on_system_removed(self, removed):
+        """Notify listeners and refresh the combo box after a system is removed."""
+        system_id, system_name = removed
+        
+        # Emit signal that system was removed
+        self.system_removed.emit(system_id)
+        
+        QMessageBox.information(
+            self,
+            "System Removed",
+            f"System '{system_name}' has been removed successfully."
+        )
+        
+        # Refresh the combo box
+        self.populate_system_combo()
+    
+    def _on_system_remove_failed(self, message: str):
+        """Report a failed system removal."""
+        QMessageBox.critical(
+            self,
+            "Remove Failed",
+            f"Failed to remove system: {message}"
+        )
@@ -4,212 +4,84 @@ Theme management module for Romplestiltskin.
 Separates styling from application logic.
 """
 
-class Theme:
-    """Theme class to manage application styling."""
-    
-    def __init__(self):
-        """Initialize theme with default dark colors, dimensions, and layout properties."""
-        self.colors = {
-            'background': '#1a1a1a',
-            'main_window': '#1a1a1a',  # Same as background
-            'central_widget': '#2c2c2c',
-            'dark_gray': '#0f0f0f',
-            'medium_gray': '#2a2a2a',
-            'light_gray': '#3a3a3a',
-            'highlight': '#4a4a4a',
-            'highlight_hover': '#4a4a4a',
-            'highlight_pressed': '#4a4a4a',
-            'primary': '#4a9eff',  # Same as highlight
-            'secondary': '#757575',
-            'secondary_hover': '#616161',
-            'secondary_pressed': '#424242',
-            'text': '#d1d1d1',
-            'secondary_text': '#a1a1a1',
-            'muted_text': '#757575',  # Same as secondary
-            'border': '#404040',
-            'success': '#4CAF50',
-            'warning': '#FFC107',
-            'warning_hover': '#f57c00',
-            'warning_pressed': '#ef6c00',
-            'error': '#6b211e',
-            'error_hover': '#6b211e',
-            'error_pressed': '#6b211e',
-            'button': '#2a2a2a',  # Same as medium_gray
-            'button_hover': '#3a3a3a',  # Same as light_gray
-            'button_text': '#ffffff',
-            'selection': '#4a9eff',  # Same as highlight
-            'shadow': '#1a1a1a',  # Dark shadow color for button effects
-            'group_bg': '#3e3e3e',  # Background color for group boxes
-            # Tree item colors
-            'tree_item_correct_bg': '#c8ffc8',  # Light green (200, 255, 200)
-            'tree_item_correct_text': '#000000',  # Black text (0, 0, 0)
-            # Drag and drop colors
-            'drag_drop': {
-                'highlight_border': '#d6d6d6',  # Color for the drop indicator line
-                'highlight_background': 'rgba(0, 120, 212, 0.1)', # Retained for now, might be unused
-                'available_bg': '#2c2c2c',
-                'available_item': 'transparent',
-                'available_text': '#d6d6d6',
-                'available_selected_bg': '#2c2c2c',  # Same as available_bg
-                'available_hover_bg': '#2c2c2c', # Same as available_bg to avoid color change
-                'available_hover_text': '#d6d6d6', # Same as available_text to avoid color change
-                'ignored_hover_bg': '#2c2c2c',  # Same as ignored_bg to avoid color change
-                'ignored_hover_text': '#d99595', # Same as ignored_text to avoid color change
-                'ignored_bg': '#2c2c2c',
-                'ignored_item': 'transparent',
-                'ignored_selected_bg': '#2c2c2c',  # Same as ignored_bg
-                'ignored_text': '#d99595'
-            },
-            # Progress dialog colors
-            'progress_dialog': {
-                'details_text': '#757575',  # Gray color for details text
-                'details_font_size': '10px'
-            }
-        }
-        
-        # Dimensions for widgets (organized by category)
-        self.dimensions = {
-            'widget': {
-                'button_min_height': 30,
-                'button_min_width': 80,
-                'premium_button_min_height': 36,
-                'input_min_height': 30,
-                'combo_min_height': 30,
-                'tree_header_height': 25,
-                'list_item_height': 24,
-                'checkbox_size': 16,
-                'radio_size': 16,
-                'scrollbar_width': 12,
-                'scrollbar_handle_min': 20
-            },
-            'border': {
-                'radius': 4,
-                'radius_large': 8,
-                'radius_medium': 6,
-                'radius_small': 3,
-                'width': 1,
-                'width_thick': 2
-            },
-            'main_window': {
-                'combo_minimum_width': 300,
-                'tree_minimum_height': 250,
-                'tree_maximum_height': 300,
-                'dat_tree_minimum_height': 300,
-                'dat_tree_maximum_height': 350,
-                'panel_maximum_height': 300,
-                'language_scroll_maximum_height': 120,
-                'min_width': 1400,
-                'min_height': 900
-            },
-            'settings_dialog': {
-                'list_maximum_height': 120,
-                'width': 600,
-                'height': 500
-            },
-            'progress_dialog': {
-                'log_max_height': 100,
-                'width': 400,
-                'height': 200,
-                'expanded_height': 300
-            },
-            # Legacy flat structure for backward compatibility
-            'button_min_height': 30,
-            'button_min_width': 80,
-            'premium_button_min_height': 36,
-            'input_min_height': 30,
-            'combo_min_height': 30,
-            'tree_header_height': 25,
-            'list_item_height': 24,
-            'checkbox_size': 16,
-            'radio_size': 16,
-            'scrollbar_width': 12,
-            'scrollbar_handle_min': 20,
-            'border_radius': 4,
-            'border_radius_large': 8,
-            'border_radius_medium': 6,
-            'border_radius_small': 3,
-            'border_width': 1,
-            'border_width_thick': 2,
-            'combo_minimum_width': 300,
-            'tree_minimum_height': 250,
-            'tree_maximum_height': 300,
-            'dat_tree_minimum_height': 300,
-            'dat_tree_maximum_height': 350,
-            'panel_maximum_height': 300,
-            'language_scroll_maximum_height': 120,
-            'settings_list_maximum_height': 120,
-            'settings_dialog_width': 600,
-            'settings_dialog_height': 500,
-            'progress_log_max_height': 100,
-            'main_window_min_width': 1400,
-            'main_window_min_height': 900,
-            'progress_dialog_width': 400,
-            'progress_dialog_height': 200,
-            'progress_dialog_expanded_height': 300
-        }
-        
-        # Spacing and padding values
-        self.spacing = {
-            'tiny': 2,
-            'small': 4,
-            'medium': 6,
-            'large': 8,
-            'xlarge': 10,
-            'xxlarge': 12,
-            'huge': 16,
-            'massive': 20
-        }
-        
-        # Layout margins and padding
-        self.layout = {
-            'window_padding': '1%',
-            'main_window_margins': 15,
-            'central_widget_margin_top': 30,
-            'dialog_margin': 10,
-            'group_margin_top': 12,
-            'filter_group_margin_top': 10,
-            'title_padding': '0 5px',
-            'title_left_offset': 10,
-            'button_padding': '8px 16px',
-            'premium_button_padding': '10px 20px',
-            'input_padding': '6px',
-            'item_padding': '4px',
-            'menu_item_padding': '6px 10px 6px 10px',
-            'menu_item_full_padding': '5px 12px 5px 12px',
-            'tab_padding': '8px 16px',
-            'header_padding': '6px',
-            # Column widths for tree widgets
-            'tree_index_column_width': 50,
-            'tree_name_column_width': 300,
-            # Stats label styling
-            'stats_label_padding': '5px',
-            # Settings dialog specific layout
-            'settings_contents_margins': '20px 20px 20px 20px',
-            'settings_tab_spacing': 20,
-            'settings_group_spacing': 15,
-            'settings_button_spacing': 10,
-            'settings_modern_button_padding': '8px 16px',
-            'settings_secondary_button_padding': '8px 16px',
-            'settings_danger_button_padding': '12px 24px',
-            'settings_warning_button_padding': '10px 20px',
-            'help_text_font_size': '10px',
-            'help_text_margin': '20px'
-        }
-        
-        # Font properties
-        self.fonts = {
-            'family': "'Segoe UI', Arial, sans-serif",
-            'size_small': 11,
-            'size_normal': 12,
-            'size_medium': 13,
-            'size_large': 14,
-            'weight_normal': 'normal',
-            'weight_bold': 'bold'
-        }
-    
-    def get_stylesheet(self):
-        """Get the complete application stylesheet."""
-        return f"""
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from types import MappingProxyType
+
+# Primitive palette; the theme colors below refer to these so shared values stay in sync
+_PAL = {
+    'bg': '#1a1a1a',
+    'panel': '#2c2c2c',
+    'dark_gray': '#0f0f0f',
+    'medium_gray': '#2a2a2a',
+    'light_gray': '#3a3a3a',
+    'group_bg': '#3e3e3e',
+    'border': '#404040',
+    'highlight': '#4a4a4a',
+    'gray': '#757575',
+    'gray_hover': '#616161',
+    'gray_pressed': '#424242',
+    'accent': '#4a9eff',
+    'text': '#d1d1d1',
+    'secondary_text': '#a1a1a1',
+    'list_text': '#d6d6d6',
+    'ignored_text': '#d99595',
+    'white': '#ffffff',
+    'black': '#000000',
+    'mint': '#c8ffc8',
+    'green': '#4CAF50',
+    'amber': '#FFC107',
+    'orange': '#f57c00',
+    'dark_orange': '#ef6c00',
+    'red': '#6b211e',
+}
+
+# Prefixes that turn nested dimension keys into their flat names
+_DIMENSION_PREFIXES = {
+    'widget': '',
+    'border': 'border_',
+    'main_window': '',
+    'settings_dialog': 'settings_dialog_',
+    'progress_dialog': 'progress_dialog_',
+}
+
+# Flat names that don't follow the prefix rule
+_DIMENSION_ALIASES = {
+    ('main_window', 'min_width'): 'main_window_min_width',
+    ('main_window', 'min_height'): 'main_window_min_height',
+    ('settings_dialog', 'list_maximum_height'): 'settings_list_maximum_height',
+    ('progress_dialog', 'log_max_height'): 'progress_log_max_height',
+}
+
+
+# Widget setter for each dimension key suffix, checked in order by apply_dimensions
+_SUFFIX_TO_SETTER = {
+    'min_height': 'setMinimumHeight',
+    'min_width': 'setMinimumWidth',
+    'max_height': 'setMaximumHeight',
+    'max_width': 'setMaximumWidth',
+    'width': 'setFixedWidth',
+    'height': 'setFixedHeight',
+}
+
+
+def _flatten_dimensions(dimensions):
+    """Map nested dimensions onto their flat key names."""
+    return {
+        _DIMENSION_ALIASES.get((category, key), _DIMENSION_PREFIXES[category] + key): value
+        for category, values in dimensions.items()
+        for key, value in values.items()
+    }
+
+
+# Application stylesheet sections, rendered with Theme._ss_ns and joined in this order
+# (later sections override earlier ones). Colors, flat dimensions and layout values
+# use their own names; fonts and spacing are prefixed with font_/spacing_.
+_STYLESHEET_SECTIONS = {
+    # Window, panel, splitter and dialog basics
+    'global': """
         /* Global styles */
         QCheckBox, QLabel {{
             background: transparent;
@@ -220,10 +92,10 @@ class Theme:
         }}
 
         QMainWindow {{
-            background-color: {self.colors['background']}; 
-            color: {self.colors['text']};
-            font-family: {self.fonts['family']};
-            font-size: {self.fonts['size_normal']}px;
+            background-color: {background}; 
+            color: {text};
+            font-family: {font_family};
+            font-size: {font_size_normal}px;
         }}
         
         /* Panel containers should be transparent */
@@ -237,7 +109,7 @@ class Theme:
         
         /* Group boxes should have central_widget color */
         QGroupBox#dat_panel, QGroupBox#rom_panel, QGroupBox#actions_panel, QGroupBox#filter_group {{
-            background-color: {self.colors['central_widget']};
+            background-color: {central_widget};
         }}
         
         /* QSplitter styling */
@@ -252,16 +124,16 @@ class Theme:
         
         /* Main window */
         QMainWindow {{
-            background-color: {self.colors['main_window']};
-            border: 2px solid {self.colors['border']};
+            background-color: {main_window};
+            border: 2px solid {border};
         }}
         
 
         
         /* Central widget to show padding */
         QMainWindow > QWidget#centralWidget {{
-            background-color: {self.colors['central_widget']};
-            border-radius: {self.dimensions['border_radius']}px;
+            background-color: {central_widget};
+            border-radius: {border_radius}px;
         }}
         
         /* Override for specific widgets */
@@ -271,14 +143,16 @@ class Theme:
         
         /* Dialog windows */
         QDialog {{
-            background-color: {self.colors['group_bg']};
-             color: {self.colors['text']};
+            background-color: {group_bg};
+             color: {text};
          }}
         
-        /* Menu bar */
+""",
+    # Menu bar and menus
+    'menus': """        /* Menu bar */
         QMenuBar {{
-            background-color: {self.colors['background']};
-            color: {self.colors['text']};
+            background-color: {background};
+            color: {text};
             margin: 0px;
             padding-left: 0px;
             padding-right: 0px;
@@ -289,24 +163,24 @@ class Theme:
         
         QMenuBar::item {{
             background-color: transparent;
-            padding: {self.layout['menu_item_padding']};
+            padding: {menu_item_padding};
             margin: 0px;
             border: none;
             margin-right: -1px; /* Remove gaps between menu items */
         }}
         
         QMenuBar::item:selected {{
-            background-color: {self.colors['highlight']};
+            background-color: {highlight};
         }}
         
         QMenuBar::item:hover {{
             /* Ensure hover doesn't affect other elements */
-            background-color: {self.colors['highlight']};
+            background-color: {highlight};
         }}
         
         QMenu {{
-            background-color: {self.colors['central_widget']};
-            border: {self.dimensions['border_width']}px solid {self.colors['border']};
+            background-color: {central_widget};
+            border: {border_width}px solid {border};
             margin: 0px;
             padding: 0px;
             spacing: 0px;
@@ -314,15 +188,15 @@ class Theme:
 
         QMenu::item {{
             padding: 8px 10px 8px 10px;
-            background-color: {self.colors['central_widget']};
-            color: {self.colors['text']};
+            background-color: {central_widget};
+            color: {text};
             margin: 0px;
             border: none;
         }}
 
         QMenu::item:selected {{
-            background-color: {self.colors['highlight']};
-            color: {self.colors['text']};
+            background-color: {highlight};
+            color: {text};
         }}
         
         QMenu::right-arrow {{
@@ -333,21 +207,23 @@ class Theme:
         
         QMenu::separator {{
             height: 1px;
-            background-color: {self.colors['border']};
+            background-color: {border};
             margin: 2px 5px 2px 5px;
         }}
         
         /* Status bar styling is now applied directly to the widget */
         
-        /* Group boxes */
+""",
+    # Group boxes and labels
+    'groups': """        /* Group boxes */
         QGroupBox {{
-            background: {self.colors['group_bg']}; /* Ensure this is #3e3e3e */
-            border: {self.dimensions['border_width']}px solid {self.colors['border']};
-            border-radius: {self.dimensions['border_radius']}px;
-            margin-top: {self.layout['group_margin_top']}px;
-            font-weight: {self.fonts['weight_bold']};
-            padding-top: {self.spacing['xlarge']}px;
-            color: {self.colors['text']};
+            background: {group_bg}; /* Ensure this is #3e3e3e */
+            border: {border_width}px solid {border};
+            border-radius: {border_radius}px;
+            margin-top: {group_margin_top}px;
+            font-weight: {font_weight_bold};
+            padding-top: {spacing_xlarge}px;
+            color: {text};
         }}
         
         /* Ensure checkboxes, labels, scroll areas and widgets in group boxes have transparent backgrounds */
@@ -360,36 +236,38 @@ class Theme:
         
         QGroupBox::title {{
             subcontrol-origin: margin;
-            left: {self.layout['title_left_offset']}px;
-            padding: {self.layout['title_padding']};
+            left: {title_left_offset}px;
+            padding: {title_padding};
         }}
         
         /* Labels */
         QLabel {{
-            color: {self.colors['text']};
+            color: {text};
             background-color: transparent;
         }}
         
-        /* Buttons */
+""",
+    # Push buttons
+    'buttons': """        /* Buttons */
         QPushButton {{
-            background-color: {self.colors['medium_gray']};
-            color: {self.colors['button_text']};
+            background-color: {medium_gray};
+            color: {button_text};
             border: none;
-            border-radius: {self.dimensions['border_radius']}px;
-            padding: {self.layout['button_padding']};
-            font-weight: {self.fonts['weight_bold']};
-            min-height: {self.dimensions['button_min_height']}px;
-            min-width: {self.dimensions['button_min_width']}px;
+            border-radius: {border_radius}px;
+            padding: {button_padding};
+            font-weight: {font_weight_bold};
+            min-height: {button_min_height}px;
+            min-width: {button_min_width}px;
         }}
         
 
         
         QPushButton:hover {{
-            background-color: {self.colors['light_gray']};
+            background-color: {light_gray};
         }}
         
         QPushButton:pressed {{
-            background-color: {self.colors['highlight']};
+            background-color: {highlight};
         }}
 
         /* Buttons inside dialogs */
@@ -417,25 +295,27 @@ class Theme:
         
         /* Premium action buttons */
         #premium_button {{
-            background-color: {self.colors['highlight']};
-            color: {self.colors['text']};
+            background-color: {highlight};
+            color: {text};
             border: none;
-            border-radius: {self.dimensions['border_radius']}px;
-            padding: {self.layout['premium_button_padding']};
-            font-weight: {self.fonts['weight_bold']};
-            min-height: {self.dimensions['premium_button_min_height']}px;
-            font-size: {self.fonts['size_medium']}px;
+            border-radius: {border_radius}px;
+            padding: {premium_button_padding};
+            font-weight: {font_weight_bold};
+            min-height: {premium_button_min_height}px;
+            font-size: {font_size_medium}px;
         }}
         
         #premium_button:hover {{
-            background-color: {self.colors['highlight_hover']};
+            background-color: {highlight_hover};
         }}
         
-        /* Tree widgets */
+""",
+    # Tree widgets and headers
+    'tree': """        /* Tree widgets */
         QTreeWidget {{
             background-color: #3e3e3e;
             border: none;
-            color: {self.colors['text']};
+            color: {text};
         }}
 
         QTreeWidget::item:alternate {{
@@ -445,11 +325,11 @@ class Theme:
         QTreeWidget::item {{
             background-color: #3e3e3e;
             border-bottom: none;
-            padding-top: {self.spacing['small']}px;
-            padding-bottom: {self.spacing['small']}px;
-            padding-right: {self.spacing['small']}px;
-            padding-left: {self.spacing['small']}px;
-            min-height: {self.dimensions['list_item_height']}px;
+            padding-top: {spacing_small}px;
+            padding-bottom: {spacing_small}px;
+            padding-right: {spacing_small}px;
+            padding-left: {spacing_small}px;
+            min-height: {list_item_height}px;
         }}
 
         QTreeWidget::item:hover {{
@@ -457,26 +337,28 @@ class Theme:
         }}
 
         QTreeWidget::item:selected {{
-            background-color: {self.colors['highlight']};
-            color: {self.colors['text']};
+            background-color: {highlight};
+            color: {text};
         }}
 
         QHeaderView::section {{
             background-color: #2c2c2c;
-            color: {self.colors['text']};
-            padding: {self.layout['header_padding']};
+            color: {text};
+            padding: {header_padding};
             border: none;
-            min-height: {self.dimensions['tree_header_height']}px;
+            min-height: {tree_header_height}px;
         }}
         
-        /* Combo box */
+""",
+    # Combo boxes (with their popup scrollbars), line and text edits
+    'inputs': """        /* Combo box */
         QComboBox {{
-            background-color: {self.colors['medium_gray']};
-            border: {self.dimensions['border_width']}px solid {self.colors['border']};
-            border-radius: {self.dimensions['border_radius']}px;
-            padding: {self.layout['input_padding']};
-            min-height: {self.dimensions['combo_min_height']}px;
-            color: {self.colors['text']};
+            background-color: {medium_gray};
+            border: {border_width}px solid {border};
+            border-radius: {border_radius}px;
+            padding: {input_padding};
+            min-height: {combo_min_height}px;
+            color: {text};
         }}
 
         /* Scrollbar styles from QDarkStyleSheet */
@@ -537,55 +419,57 @@ class Theme:
         QComboBox::drop-down {{
             subcontrol-origin: padding;
             subcontrol-position: top right;
-            width: {self.spacing['massive']}px;
-            border-left: {self.dimensions['border_width']}px solid {self.colors['border']};
+            width: {spacing_massive}px;
+            border-left: {border_width}px solid {border};
         }}
         
         QComboBox QAbstractItemView {{
-            background-color: {self.colors['medium_gray']};
-            border: {self.dimensions['border_width']}px solid {self.colors['border']};
-            color: {self.colors['text']};
+            background-color: {medium_gray};
+            border: {border_width}px solid {border};
+            color: {text};
         }}
         
         /* Line edit */
         QLineEdit {{
             background-color: #2c2c2c;
-            border: {self.dimensions['border_width']}px solid {self.colors['border']};
-            border-radius: {self.dimensions['border_radius']}px;
-            padding: {self.layout['input_padding']};
-            min-height: {self.dimensions['input_min_height']}px;
-            color: {self.colors['text']};
+            border: {border_width}px solid {border};
+            border-radius: {border_radius}px;
+            padding: {input_padding};
+            min-height: {input_min_height}px;
+            color: {text};
         }}
         
         QLineEdit:focus {{
-            border: {self.dimensions['border_width_thick']}px solid {self.colors['highlight']};
+            border: {border_width_thick}px solid {highlight};
         }}
         
         /* Text edit */
         QTextEdit {{
             background-color: #2c2c2c;
-            border: {self.dimensions['border_width']}px solid {self.colors['border']};
-            border-radius: {self.dimensions['border_radius']}px;
-            color: {self.colors['text']};
-            padding: {self.layout['input_padding']};
+            border: {border_width}px solid {border};
+            border-radius: {border_radius}px;
+            color: {text};
+            padding: {input_padding};
         }}
         
-        /* List widgets */
+""",
+    # List widgets
+    'lists': """        /* List widgets */
         QListWidget {{
-            background-color: {self.colors['dark_gray']};
-            border: {self.dimensions['border_width']}px solid {self.colors['border']};
-            border-radius: {self.dimensions['border_radius']}px;
-            color: {self.colors['text']};
+            background-color: {dark_gray};
+            border: {border_width}px solid {border};
+            border-radius: {border_radius}px;
+            color: {text};
         }}
         
         QListWidget::item {{
-            padding: {self.spacing['small']}px;
-            min-height: {self.dimensions['list_item_height']}px;
+            padding: {spacing_small}px;
+            min-height: {list_item_height}px;
         }}
         
         QListWidget::item:selected {{
-            background-color: {self.colors['highlight']};
-            color: {self.colors['text']};
+            background-color: {highlight};
+            color: {text};
         }}
         
         /* Override for drag-drop lists to prevent blue highlighting */
@@ -601,22 +485,26 @@ class Theme:
              background-color: transparent; 
         }}
         
-        /* Progress bar */
+""",
+    # Progress bars
+    'progress': """        /* Progress bar */
         QProgressBar {{
-            background-color: {self.colors['medium_gray']};
-            border: {self.dimensions['border_width']}px solid {self.colors['border']};
-            border-radius: {self.dimensions['border_radius']}px;
+            background-color: {medium_gray};
+            border: {border_width}px solid {border};
+            border-radius: {border_radius}px;
             text-align: center;
-            color: {self.colors['text']};
-            min-height: {self.dimensions['input_min_height']}px;
+            color: {text};
+            min-height: {input_min_height}px;
         }}
         
         QProgressBar::chunk {{
-            background-color: {self.colors['highlight']};
-            border-radius: {self.dimensions['border_radius_small']}px;
+            background-color: {highlight};
+            border-radius: {border_radius_small}px;
         }}
         
-        /* Tab widget */
+""",
+    # Tab widgets
+    'tabs': """        /* Tab widget */
         QTabWidget::pane {{
             border: none;
             background-color: transparent;
@@ -653,54 +541,58 @@ class Theme:
         
         /* Tab styling is handled entirely in main_window.py */
         
-        /* Scroll bars */
+""",
+    # Scroll bars; overrides the combo popup scrollbar rules above
+    'scroll': """        /* Scroll bars */
         QScrollBar:vertical {{
-            background-color: {self.colors['medium_gray']};
-            width: {self.dimensions['scrollbar_width']}px;
-            border-radius: {self.dimensions['scrollbar_width']//2}px;
+            background-color: {medium_gray};
+            width: {scrollbar_width}px;
+            border-radius: {scrollbar_radius}px;
         }}
         
         QScrollBar::handle:vertical {{
-            background-color: {self.colors['light_gray']};
-            border-radius: {self.dimensions['scrollbar_width']//2}px;
-            min-height: {self.dimensions['scrollbar_handle_min']}px;
+            background-color: {light_gray};
+            border-radius: {scrollbar_radius}px;
+            min-height: {scrollbar_handle_min}px;
         }}
         
         QScrollBar::handle:vertical:hover {{
-            background-color: {self.colors['highlight']};
+            background-color: {highlight};
         }}
         
         QScrollBar:horizontal {{
-            background-color: {self.colors['medium_gray']};
-            height: {self.dimensions['scrollbar_width']}px;
-            border-radius: {self.dimensions['scrollbar_width']//2}px;
+            background-color: {medium_gray};
+            height: {scrollbar_width}px;
+            border-radius: {scrollbar_radius}px;
         }}
         
         QScrollBar::handle:horizontal {{
-            background-color: {self.colors['light_gray']};
-            border-radius: {self.dimensions['scrollbar_width']//2}px;
-            min-width: {self.dimensions['scrollbar_handle_min']}px;
+            background-color: {light_gray};
+            border-radius: {scrollbar_radius}px;
+            min-width: {scrollbar_handle_min}px;
         }}
         
         QScrollBar::handle:horizontal:hover {{
-            background-color: {self.colors['highlight']};
+            background-color: {highlight};
         }}
         
-        /* Spin box */
+""",
+    # Spin boxes and checkbox indicators
+    'controls': """        /* Spin box */
         QSpinBox {{
             background-color: #2c2c2c;
-            border: {self.dimensions['border_width']}px solid {self.colors['border']};
-            border-radius: {self.dimensions['border_radius']}px;
-            padding: {self.layout['input_padding']};
-            min-height: {self.dimensions['input_min_height']}px;
-            color: {self.colors['text']};
+            border: {border_width}px solid {border};
+            border-radius: {border_radius}px;
+            padding: {input_padding};
+            min-height: {input_min_height}px;
+            color: {text};
         }}
         
         /* Checkbox */
         QCheckBox::indicator {{
             width: 16px;
             height: 16px;
-            border: 1px solid {self.colors['group_bg']};
+            border: 1px solid {group_bg};
             border-radius: 3px;
             background-color: transparent;
             border: 2px solid #484848;
@@ -714,197 +606,644 @@ class Theme:
             background-color: #4CAF50;
         }}
         
+        """,
+}
+
+
+# Shared by the available and ignored drag-drop lists, which only differ in colors
+_DRAG_LIST_TEMPLATE = """
+            QListWidget {{
+                border: none;
+                outline: none;
+                background-color: {bg};
+                color: {text};
+                font-family: {font_family};
+                font-size: {font_size}px;
+                font-weight: normal;
+            }}
+            QListWidget::item {{
+                padding: {padding}px;
+                border: none;
+                outline: none;
+                font-family: {font_family};
+                font-size: {font_size}px;
+                font-weight: normal;
+            }}
+            QListWidget::item:selected {{
+                background-color: {bg}; /* Keep same as item background */
+                color: {text};
+                border: none;
+                outline: none;
+                font-family: {font_family};
+                font-size: {font_size}px;
+                font-weight: normal;
+            }}
+            QListWidget::item:selected:active {{
+                background-color: {bg};
+                color: {text};
+                border: none;
+                outline: none;
+            }}
+            QListWidget::item:selected:focus {{
+                background-color: {bg};
+                color: {text};
+                border: none;
+                outline: none;
+            }}
+            QListWidget::item:hover {{
+                background-color: {hover_bg};
+                color: {hover_text};
+                border: none;
+                outline: none;
+            }}
         """
+
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_WHITESPACE = re.compile(r'\s+')
+
+
+def _minify_css(css):
+    """Strip comments and redundant whitespace so Qt has less stylesheet to parse."""
+    css = _CSS_WHITESPACE.sub(' ', _CSS_COMMENT.sub('', css))
+    for padded, tight in (('; ', ';'), (' {', '{'), ('{ ', '{'), (' }', '}'), (': ', ':')):
+        css = css.replace(padded, tight)
+    return css.strip()
+
+
+def _cached_style(method):
+    """Cache a zero-argument style getter's result on the theme instance."""
+    name = method.__name__
     
-    def get_button_style(self, style_type="default"):
-        """Get specific button styles for consistency."""
-        if style_type == "modern":
-            return f"""
-                QPushButton {{
-                    background-color: {self.colors['highlight']};
-                    color: {self.colors['text']};
-                    border: none;
-                    border-radius: {self.dimensions['border_radius']}px;
-                    padding: {self.layout['button_padding']};
-                    font-size: {self.fonts['size_normal']}px;
-                    font-weight: {self.fonts['weight_bold']};
-                    min-height: {self.dimensions['button_min_height']}px;
-                    min-width: {self.dimensions['button_min_width']}px;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.colors['highlight_hover']};
-                }}
-                QPushButton:pressed {{
-                    background-color: {self.colors['light_gray']};
-                }}
-            """
-        elif style_type == "danger":
-            return f"""
-                QPushButton {{
-                    background-color: {self.colors['error']};
-                    color: {self.colors['text']};
-                    border: none;
-                    border-radius: {self.dimensions['border_radius']}px;
-                    padding: {self.layout['button_padding']};
-                    font-size: {self.fonts['size_normal']}px;
-                    font-weight: {self.fonts['weight_bold']};
-                    min-height: {self.dimensions['button_min_height']}px;
-                    min-width: {self.dimensions['button_min_width']}px;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.colors['error_hover']};
-                }}
-                QPushButton:pressed {{
-                    background-color: {self.colors['error_pressed']};
-                }}
-            """
-        elif style_type == "QMainButton":
-            return f"""
-                QPushButton {{
-                    background-color: #383838;
-                    color: {self.colors['button_text']};
-                    border: 1px solid {self.colors['border']};
-                    border-radius: 8px;
-                    padding: 5px 15px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-weight: normal;
-                    font-size: {self.fonts['size_normal']}px;
-                }}
-                QPushButton:hover {{
-                    background-color: #484848;
-                }}
-                QPushButton:pressed {{
-                    background-color: #282828;
-                }}
-            """
-        elif style_type == "ScanButton":
-            base_style = self.get_button_style("QMainButton")
-            return base_style.replace(f"background-color: {self.colors['button']};", f"background-color: {self.colors['button_hover']};")
-        elif style_type == "ClearButton":
-            return f"""
-                QPushButton {{
-                    background-color: #6b211e;
-                    color: {self.colors['button_text']};
-                    border: 1px solid #6b211e;
-                    border-radius: 8px;
-                    padding: 5px 15px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-weight: normal;
-                    font-size: {self.fonts['size_normal']}px;
-                }}
-                QPushButton:hover {{
-                    background-color: #7a2622;
-                }}
-                QPushButton:pressed {{
-                    background-color: #5c1e1a;
-                }}
-            """
-        elif style_type == "SelectAllButton":
-            return f"""
-                QPushButton {{
-                    background-color: {self.colors['button']};
-                    color: {self.colors['button_text']};
-                    border: 1px solid {self.colors['border']};
-                    border-radius: 8px;
-                    padding: 0px 5px 3px 5px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-weight: normal;
-                    font-size: {self.fonts['size_normal']}px;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.colors['button_hover']};
-                }}
-                QPushButton:pressed {{
-                    background-color: {self.colors['button_hover']};
-                }}
-            """
-        elif style_type == "ClearAllButton":
-            return f"""
-                QPushButton {{
-                    background-color: #6b211e;
-                    color: {self.colors['button_text']};
-                    border: 1px solid #6b211e;
-                    border-radius: 8px;
-                    padding: 0px 5px 3px 5px;
-                    font-family: 'Segoe UI', Arial, sans-serif;
-                    font-weight: normal;
-                    font-size: {self.fonts['size_normal']}px;
-                }}
-                QPushButton:hover {{
-                    background-color: #7a2622;
-                }}
-                QPushButton:pressed {{
-                    background-color: #5c1e1a;
-                }}
-            """
-        elif style_type == "CircularMoveButton":
-            return f"""
-                QPushButton {{
-                    background-color: #6b211e;
-                    color: {self.colors['button_text']};
-                    border: none;
-                    border-radius: 10px !important;
-                    padding: 0px;
-                    width: 20px;
-                    height: 20px;
-                    max-width: 20px;
-                    max-height: 20px;
-                    min-width: 20px;
-                    min-height: 20px;
-                    margin: 0px;
-                    font-size: 10px;
-                    font-weight: normal;
-                }}
-                QPushButton:hover {{
-                    background-color: #7a2622;
-                }}
-                QPushButton:pressed {{
-                    background-color: #5c1e1a;
-                }}
-            """
-        else:
-            return f"""
-                QPushButton {{
-                    background-color: {self.colors['medium_gray']};
-                    color: {self.colors['button_text']};
-                    border: none;
-                    border-radius: {self.dimensions['border_radius']}px;
-                    padding: {self.layout['button_padding']};
-                    font-weight: {self.fonts['weight_bold']};
-                    min-height: {self.dimensions['button_min_height']}px;
-                    min-width: {self.dimensions['button_min_width']}px;
+    @wraps(method)
+    def wrapper(self):
+        style = self._style_cache.get(name)
+        if style is None:
+            # Interned so widgets given the same style share one string object
+            style = self._style_cache[name] = sys.intern(_minify_css(method(self)))
+        return style
+    wrapper._cached_style = True
+    return wrapper
+
+
+@dataclass(frozen=True, slots=True)
+class Colors:
+    """Theme colors as attributes, for code that reads known colors often.
+    
+    Mirrors the keys of Theme.colors, which remains the string-keyed API.
+    """
+    background: str
+    main_window: str
+    central_widget: str
+    dark_gray: str
+    medium_gray: str
+    light_gray: str
+    highlight: str
+    highlight_hover: str
+    highlight_pressed: str
+    primary: str
+    secondary: str
+    secondary_hover: str
+    secondary_pressed: str
+    text: str
+    secondary_text: str
+    muted_text: str
+    border: str
+    success: str
+    warning: str
+    warning_hover: str
+    warning_pressed: str
+    error: str
+    error_hover: str
+    error_pressed: str
+    button: str
+    button_hover: str
+    button_text: str
+    selection: str
+    shadow: str
+    group_bg: str
+    tree_item_correct_bg: str
+    tree_item_correct_text: str
+    drag_drop_highlight_border: str
+    drag_drop_highlight_background: str
+    drag_drop_available_bg: str
+    drag_drop_available_item: str
+    drag_drop_available_text: str
+    drag_drop_available_selected_bg: str
+    drag_drop_available_hover_bg: str
+    drag_drop_available_hover_text: str
+    drag_drop_ignored_hover_bg: str
+    drag_drop_ignored_hover_text: str
+    drag_drop_ignored_bg: str
+    drag_drop_ignored_item: str
+    drag_drop_ignored_selected_bg: str
+    drag_drop_ignored_text: str
+    progress_dialog_details_text: str
+    progress_dialog_details_font_size: str
+
+
+# Shared QPushButton stylesheet; variants only differ in their base properties
+# and hover/pressed backgrounds.
+_BUTTON_TEMPLATE = """
+                {selector} {{
+{properties}
                 }}
-                QPushButton:hover {{
-                    background-color: {self.colors['light_gray']};
+                {selector}:hover {{
+                    background-color: {hover};
                 }}
-                QPushButton:pressed {{
-                    background-color: {self.colors['highlight']};
+                {selector}:pressed {{
+                    background-color: {pressed};
                 }}
             """
+
+# Button variants that are styled from the application stylesheet, keyed to the
+# object name a button needs to pick the variant up.
+_BUTTON_OBJECT_NAMES = {
+    'QMainButton': 'mainButton',
+    'ScanButton': 'scanButton',
+    'ClearButton': 'clearButton',
+    'SelectAllButton': 'selectAllButton',
+    'ClearAllButton': 'clearAllButton',
+}
+
+
+# Base properties for create_widget_style, rendered against the stylesheet namespace
+_WIDGET_STYLE_TEMPLATES = {
+    'button': {
+        'background-color': '{medium_gray}',
+        'color': '{button_text}',
+        'border': 'none',
+        'border-radius': '{border_radius}px',
+        'padding': '{button_padding}',
+        'font-weight': '{font_weight_bold}',
+        'min-height': '{button_min_height}px',
+        'min-width': '{button_min_width}px'
+    },
+    'input': {
+        'background-color': '{medium_gray}',
+        'border': '{border_width}px solid {border}',
+        'border-radius': '{border_radius}px',
+        'padding': '{input_padding}',
+        'min-height': '{input_min_height}px',
+        'color': '{text}'
+    },
+    'list': {
+        'background-color': '{dark_gray}',
+        'border': '{border_width}px solid {border}',
+        'border-radius': '{border_radius}px',
+        'color': '{text}'
+    }
+}
+
+
+class Theme:
+    """Theme class to manage application styling."""
+    
+    # Everything an instance carries is bound in __init__; no per-instance __dict__
+    __slots__ = (
+        'colors', 'dimensions', 'spacing', 'layout', 'fonts',
+        '_dims_flat', '_dims_dotted', '_scrollbar_radius', '_sizes', '_ss_ns',
+        '_base_styles', '_base_style_strings', '_button_variants',
+        '_stylesheet_cache', '_global_stylesheet_cache', '_stylesheet_bytes_cache',
+        '_section_cache',
+        '_button_style_cache', '_style_cache',
+    )
+    
+    # Default dark colors
+    _COLORS = {
+        'background': _PAL['bg'],
+        'main_window': _PAL['bg'],
+        'central_widget': _PAL['panel'],
+        'dark_gray': _PAL['dark_gray'],
+        'medium_gray': _PAL['medium_gray'],
+        'light_gray': _PAL['light_gray'],
+        'highlight': _PAL['highlight'],
+        'highlight_hover': _PAL['highlight'],
+        'highlight_pressed': _PAL['highlight'],
+        'primary': _PAL['accent'],
+        'secondary': _PAL['gray'],
+        'secondary_hover': _PAL['gray_hover'],
+        'secondary_pressed': _PAL['gray_pressed'],
+        'text': _PAL['text'],
+        'secondary_text': _PAL['secondary_text'],
+        'muted_text': _PAL['gray'],
+        'border': _PAL['border'],
+        'success': _PAL['green'],
+        'warning': _PAL['amber'],
+        'warning_hover': _PAL['orange'],
+        'warning_pressed': _PAL['dark_orange'],
+        'error': _PAL['red'],
+        'error_hover': _PAL['red'],
+        'error_pressed': _PAL['red'],
+        'button': _PAL['medium_gray'],
+        'button_hover': _PAL['light_gray'],
+        'button_text': _PAL['white'],
+        'selection': _PAL['accent'],
+        'shadow': _PAL['bg'],  # Dark shadow color for button effects
+        'group_bg': _PAL['group_bg'],  # Background color for group boxes
+        # Tree item colors
+        'tree_item_correct_bg': _PAL['mint'],  # Light green (200, 255, 200)
+        'tree_item_correct_text': _PAL['black'],
+        # Drag and drop colors
+        'drag_drop_highlight_border': _PAL['list_text'],  # Color for the drop indicator line
+        'drag_drop_highlight_background': 'rgba(0, 120, 212, 0.1)', # Retained for now, might be unused
+        'drag_drop_available_bg': _PAL['panel'],
+        'drag_drop_available_item': 'transparent',
+        'drag_drop_available_text': _PAL['list_text'],
+        # Selection and hover keep the normal colors to avoid a color change
+        'drag_drop_available_selected_bg': _PAL['panel'],
+        'drag_drop_available_hover_bg': _PAL['panel'],
+        'drag_drop_available_hover_text': _PAL['list_text'],
+        'drag_drop_ignored_hover_bg': _PAL['panel'],
+        'drag_drop_ignored_hover_text': _PAL['ignored_text'],
+        'drag_drop_ignored_bg': _PAL['panel'],
+        'drag_drop_ignored_item': 'transparent',
+        'drag_drop_ignored_selected_bg': _PAL['panel'],
+        'drag_drop_ignored_text': _PAL['ignored_text'],
+        # Progress dialog colors
+        'progress_dialog_details_text': _PAL['gray'],  # Gray color for details text
+        'progress_dialog_details_font_size': '10px'
+    }
+    
+    # Attribute access to the colors above, e.g. theme.c.highlight
+    c = Colors(**_COLORS)
+    
+    # Dimensions for widgets (organized by category)
+    _DIMENSIONS = {
+        'widget': {
+            'button_min_height': 30,
+            'button_min_width': 80,
+            'premium_button_min_height': 36,
+            'input_min_height': 30,
+            'combo_min_height': 30,
+            'tree_header_height': 25,
+            'list_item_height': 24,
+            'checkbox_size': 16,
+            'radio_size': 16,
+            'scrollbar_width': 12,
+            'scrollbar_handle_min': 20
+        },
+        'border': {
+            'radius': 4,
+            'radius_large': 8,
+            'radius_medium': 6,
+            'radius_small': 3,
+            'width': 1,
+            'width_thick': 2
+        },
+        'main_window': {
+            'combo_minimum_width': 300,
+            'tree_minimum_height': 250,
+            'tree_maximum_height': 300,
+            'dat_tree_minimum_height': 300,
+            'dat_tree_maximum_height': 350,
+            'panel_maximum_height': 300,
+            'language_scroll_maximum_height': 120,
+            'min_width': 1400,
+            'min_height': 900
+        },
+        'settings_dialog': {
+            'list_maximum_height': 120,
+            'width': 600,
+            'height': 500
+        },
+        'progress_dialog': {
+            'log_max_height': 100,
+            'width': 400,
+            'height': 200,
+            'expanded_height': 300
+        }
+    }
+    
+    # Flat lookup over the nested dimensions, using the legacy flat key names
+    _DIMS_FLAT = _flatten_dimensions(_DIMENSIONS)
+    # The same values keyed by "category.key", for get_dimension(category, key)
+    _DIMS_DOTTED = {
+        f"{category}.{key}": value
+        for category, values in _DIMENSIONS.items()
+        for key, value in values.items()
+    }
+    
+    # Spacing and padding values
+    _SPACING = {
+        'tiny': 2,
+        'small': 4,
+        'medium': 6,
+        'large': 8,
+        'xlarge': 10,
+        'xxlarge': 12,
+        'huge': 16,
+        'massive': 20
+    }
+    
+    # Layout margins and padding
+    _LAYOUT = {
+        'window_padding': '1%',
+        'main_window_margins': 15,
+        'central_widget_margin_top': 30,
+        'dialog_margin': 10,
+        'group_margin_top': 12,
+        'filter_group_margin_top': 10,
+        'title_padding': '0 5px',
+        'title_left_offset': 10,
+        'button_padding': '8px 16px',
+        'premium_button_padding': '10px 20px',
+        'input_padding': '6px',
+        'item_padding': '4px',
+        'menu_item_padding': '6px 10px 6px 10px',
+        'menu_item_full_padding': '5px 12px 5px 12px',
+        'tab_padding': '8px 16px',
+        'header_padding': '6px',
+        # Column widths for tree widgets
+        'tree_index_column_width': 50,
+        'tree_name_column_width': 300,
+        # Stats label styling
+        'stats_label_padding': '5px',
+        # Settings dialog specific layout
+        'settings_contents_margins': '20px 20px 20px 20px',
+        'settings_tab_spacing': 20,
+        'settings_group_spacing': 15,
+        'settings_button_spacing': 10,
+        'settings_modern_button_padding': '8px 16px',
+        'settings_secondary_button_padding': '8px 16px',
+        'settings_danger_button_padding': '12px 24px',
+        'settings_warning_button_padding': '10px 20px',
+        'help_text_font_size': '10px',
+        'help_text_margin': '20px'
+    }
+    
+    # Font properties
+    _FONTS = {
+        'family': "'Segoe UI', Arial, sans-serif",
+        'size_small': 11,
+        'size_normal': 12,
+        'size_medium': 13,
+        'size_large': 14,
+        'weight_normal': 'normal',
+        'weight_bold': 'bold'
+    }
+    
+    # (widget_type, variant) -> style getter used by get_widget_style; unknown
+    # variants fall back to the type's 'default' entry
+    _WIDGET_DISPATCH = {
+        ('button', 'default'): 'get_button_style',
+        ('button', 'premium'): 'get_premium_button_style',
+        ('button', 'drag_drop'): 'get_drag_drop_button_style',
+        ('input', 'default'): 'get_input_style',
+        ('combo', 'default'): 'get_combo_style',
+        ('tree', 'default'): 'get_tree_style',
+        ('list', 'default'): 'get_list_style',
+        ('list', 'drag_drop'): 'get_drag_drop_list_style',
+        ('label', 'default'): 'get_label_style',
+        ('label', 'drag_drop'): 'get_drag_drop_label_style',
+        ('label', 'progress_dialog_details'): 'get_progress_dialog_details_style',
+        ('scrollbar', 'default'): 'get_scrollbar_style',
+        ('progress', 'default'): 'get_progress_bar_style',
+    }
+    
+    def __init__(self):
+        """Bind the shared theme data and set up per-instance style caches."""
+        # The data is shared by every instance and the style caches rely on it
+        # not changing, so it is only exposed through read-only views
+        self.colors = MappingProxyType(self._COLORS)
+        self.dimensions = MappingProxyType({
+            category: MappingProxyType(values) for category, values in self._DIMENSIONS.items()
+        })
+        self._dims_flat = MappingProxyType(self._DIMS_FLAT)
+        self._dims_dotted = MappingProxyType(self._DIMS_DOTTED)
+        # Scrollbar handles and grooves are rounded to half the bar width
+        self._scrollbar_radius = self._dims_flat['scrollbar_width'] // 2
+        self.spacing = MappingProxyType(self._SPACING)
+        self.layout = MappingProxyType(self._LAYOUT)
+        self.fonts = MappingProxyType(self._FONTS)
+        
+        # (width, height) pairs returned by the get_*_size helpers
+        dims = self._dims_flat
+        self._sizes = {
+            'main_window': (dims.get('main_window_min_width', 1400),
+                            dims.get('main_window_min_height', 900)),
+            'progress_dialog': (dims.get('progress_dialog_width', 400),
+                                dims.get('progress_dialog_height', 200)),
+            'progress_dialog_expanded': (dims.get('progress_dialog_width', 400),
+                                         dims.get('progress_dialog_expanded_height', 300)),
+            'settings_dialog': (dims.get('settings_dialog_width', 600),
+                                dims.get('settings_dialog_height', 500)),
+        }
+        
+        # Flat namespace the stylesheet sections are rendered against
+        self._ss_ns = {
+            **self.colors,
+            **self._dims_flat,
+            **self.layout,
+            **{f"font_{key}": value for key, value in self.fonts.items()},
+            **{f"spacing_{key}": value for key, value in self.spacing.items()},
+            'scrollbar_radius': self._scrollbar_radius,
+        }
+        
+        # Base widget styles, rendered once; property names are interned since
+        # override dicts are merged over them by key
+        self._base_styles = {
+            widget_type: {sys.intern(prop): value.format_map(self._ss_ns)
+                          for prop, value in properties.items()}
+            for widget_type, properties in _WIDGET_STYLE_TEMPLATES.items()
+        }
+        self._base_style_strings = {
+            widget_type: "".join(f"{prop}:{value};" for prop, value in properties.items())
+            for widget_type, properties in self._base_styles.items()
+        }
+        
+        # The theme doesn't change after construction, so generated styles are memoized
+        self._stylesheet_cache = None
+        self._global_stylesheet_cache = None
+        self._stylesheet_bytes_cache = None
+        self._section_cache = {}
+        self._button_style_cache = {}
+        self._style_cache = {}
+        self._button_variants = self._build_button_variants()
+        self._precompile_styles()
+    
+    def _precompile_styles(self):
+        """Render every cached style getter up front so later calls are plain lookups."""
+        for name, attr in vars(type(self)).items():
+            if getattr(attr, '_cached_style', False):
+                getattr(self, name)()
+    
+    def get_stylesheet(self, sections=None):
+        """Get the application stylesheet.
+        
+        Args:
+            sections: Names of the stylesheet sections to include (see
+                _STYLESHEET_SECTIONS). Defaults to the complete stylesheet.
+        
+        Returns:
+            The stylesheet, with sections in their cascade order
+        """
+        if sections is None:
+            if self._stylesheet_cache is None:
+                self._stylesheet_cache = "".join(
+                    self._get_stylesheet_section(name) for name in _STYLESHEET_SECTIONS)
+            return self._stylesheet_cache
+        return "".join(self._get_stylesheet_section(name)
+                       for name in _STYLESHEET_SECTIONS if name in sections)
+    
+    def apply_global_stylesheet(self, app):
+        """Set the application stylesheet on the QApplication.
+        
+        This should happen once at startup; windows and dialogs inherit it
+        instead of setting their own copy.
+        
+        Args:
+            app: The QApplication instance
+        """
+        app.setStyleSheet(self.build_global_stylesheet())
+    
+    def build_global_stylesheet(self):
+        """Get the application stylesheet including the object-name button rules.
+        
+        Buttons pick up a variant by object name (e.g. setObjectName("mainButton")
+        for QMainButton) instead of each one parsing its own stylesheet.
+        
+        Returns:
+            str: get_stylesheet() followed by a rule set per named button variant
+        """
+        if self._global_stylesheet_cache is None:
+            self._global_stylesheet_cache = self.get_stylesheet() + "".join(
+                self._render_button_style(style_type, f"QPushButton#{object_name}")
+                for style_type, object_name in _BUTTON_OBJECT_NAMES.items())
+        return self._global_stylesheet_cache
+    
+    def get_compiled_style(self, name):
+        """Get a cached widget style by name.
+        
+        Args:
+            name (str): Style name, e.g. 'settings_help_text' for
+                get_settings_help_text_style
+            
+        Returns:
+            str: The same string object on every call for a given name
+        """
+        return getattr(self, f"get_{name}_style")()
+    
+    def get_stylesheet_bytes(self):
+        """Get the global application stylesheet encoded as UTF-8.
+        
+        The stylesheet is meant to be applied once on the QApplication
+        rather than on individual widgets.
+        """
+        if self._stylesheet_bytes_cache is None:
+            self._stylesheet_bytes_cache = self.build_global_stylesheet().encode('utf-8')
+        return self._stylesheet_bytes_cache
+    
+    def _get_stylesheet_section(self, name):
+        """Render a stylesheet section on first use."""
+        section = self._section_cache.get(name)
+        if section is None:
+            section = self._section_cache[name] = _minify_css(
+                _STYLESHEET_SECTIONS[name].format_map(self._ss_ns))
+        return section
+    
+    def get_button_style(self, style_type="default"):
+        """Get specific button styles for consistency."""
+        style = self._button_style_cache.get(style_type)
+        if style is None:
+            style = self._button_style_cache[style_type] = self._render_button_style(
+                style_type, "QPushButton")
+        return style
+    
+    def _render_button_style(self, style_type, selector):
+        """Render a button variant's rules against the given selector."""
+        properties, hover, pressed = self._button_variants.get(
+            style_type, self._button_variants["default"])
+        return _minify_css(_BUTTON_TEMPLATE.format(
+            selector=selector,
+            properties="\n".join(f"                    {prop}: {value};"
+                                 for prop, value in properties.items()),
+            hover=hover,
+            pressed=pressed,
+        ))
+    
+    def _build_button_variants(self):
+        """Build the (properties, hover, pressed) table behind get_button_style."""
+        c, d, f, lay = self.colors, self._dims_flat, self.fonts, self.layout
+        
+        # Square-cornered buttons sized from the theme dimensions
+        flat = {
+            'background-color': c['highlight'],
+            'color': c['text'],
+            'border': 'none',
+            'border-radius': f"{d['border_radius']}px",
+            'padding': lay['button_padding'],
+            'font-size': f"{f['size_normal']}px",
+            'font-weight': f['weight_bold'],
+            'min-height': f"{d['button_min_height']}px",
+            'min-width': f"{d['button_min_width']}px",
+        }
+        # Rounded buttons used across the main window
+        rounded = {
+            'background-color': '#383838',
+            'color': c['button_text'],
+            'border': f"1px solid {c['border']}",
+            'border-radius': '8px',
+            'padding': '5px 15px',
+            'font-family': "'Segoe UI', Arial, sans-serif",
+            'font-weight': 'normal',
+            'font-size': f"{f['size_normal']}px",
+        }
+        rounded_red = {**rounded, 'background-color': '#6b211e', 'border': '1px solid #6b211e'}
+        compact_padding = '0px 5px 3px 5px'
+        default = {key: value for key, value in flat.items() if key != 'font-size'}
+        
+        main_button = (rounded, '#484848', '#282828')
+        return {
+            "modern": (flat, c['highlight_hover'], c['light_gray']),
+            "danger": ({**flat, 'background-color': c['error']}, c['error_hover'], c['error_pressed']),
+            "QMainButton": main_button,
+            "ScanButton": main_button,
+            "ClearButton": (rounded_red, '#7a2622', '#5c1e1a'),
+            "SelectAllButton": (
+                {**rounded, 'background-color': c['button'], 'padding': compact_padding},
+                c['button_hover'], c['button_hover']),
+            "ClearAllButton": ({**rounded_red, 'padding': compact_padding}, '#7a2622', '#5c1e1a'),
+            "CircularMoveButton": ({
+                'background-color': '#6b211e',
+                'color': c['button_text'],
+                'border': 'none',
+                'border-radius': '10px !important',
+                'padding': '0px',
+                'width': '20px',
+                'height': '20px',
+                'max-width': '20px',
+                'max-height': '20px',
+                'min-width': '20px',
+                'min-height': '20px',
+                'margin': '0px',
+                'font-size': '10px',
+                'font-weight': 'normal',
+            }, '#7a2622', '#5c1e1a'),
+            "default": (
+                {**default, 'background-color': c['medium_gray'], 'color': c['button_text']},
+                c['light_gray'], c['highlight']),
+        }
     
     def get_colors(self):
-        """Get the color palette."""
-        return self.colors.copy()
+        """Get a read-only view of the color palette."""
+        return self.colors
     
     def get_dimensions(self):
-        """Get the dimensions dictionary."""
-        return self.dimensions.copy()
+        """Get a read-only view of the dimensions dictionary."""
+        return self.dimensions
     
     def get_spacing(self):
-        """Get the spacing dictionary."""
-        return self.spacing.copy()
+        """Get a read-only view of the spacing dictionary."""
+        return self.spacing
     
     def get_layout(self):
-        """Get the layout dictionary."""
-        return self.layout.copy()
+        """Get a read-only view of the layout dictionary."""
+        return self.layout
     
     def get_fonts(self):
-        """Get the fonts dictionary."""
-        return self.fonts.copy()
-    
-    def get_dimension(self, key, default=None):
-        """Get a specific dimension value."""
-        return self.dimensions.get(key, default)
+        """Get a read-only view of the fonts dictionary."""
+        return self.fonts
     
     def get_spacing_value(self, key, default=None):
         """Get a specific spacing value."""
@@ -924,42 +1263,17 @@ class Theme:
     
     def create_widget_style(self, widget_type, **overrides):
         """Create a custom widget style with theme properties and optional overrides."""
-        base_styles = {
-            'button': {
-                'background-color': self.colors['medium_gray'],
-                'color': self.colors['button_text'],
-                'border': 'none',
-                'border-radius': f"{self.dimensions['border_radius']}px",
-                'padding': self.layout['button_padding'],
-                'font-weight': self.fonts['weight_bold'],
-                'min-height': f"{self.dimensions['button_min_height']}px",
-                'min-width': f"{self.dimensions['button_min_width']}px"
-            },
-            'input': {
-                'background-color': self.colors['medium_gray'],
-                'border': f"{self.dimensions['border_width']}px solid {self.colors['border']}",
-                'border-radius': f"{self.dimensions['border_radius']}px",
-                'padding': self.layout['input_padding'],
-                'min-height': f"{self.dimensions['input_min_height']}px",
-                'color': self.colors['text']
-            },
-            'list': {
-                'background-color': self.colors['dark_gray'],
-                'border': f"{self.dimensions['border_width']}px solid {self.colors['border']}",
-                'border-radius': f"{self.dimensions['border_radius']}px",
-                'color': self.colors['text']
-            }
-        }
+        # Common case: no overrides, so the prebuilt string is the answer
+        if not overrides:
+            return self._base_style_strings.get(widget_type, "")
         
-        if widget_type not in base_styles:
+        if widget_type not in self._base_styles:
             return ""
         
-        style_dict = base_styles[widget_type].copy()
-        style_dict.update(overrides)
-        
-        style_parts = [f"{prop}: {value};" for prop, value in style_dict.items()]
-        return " ".join(style_parts)
+        style_dict = {**self._base_styles[widget_type], **overrides}
+        return "".join(f"{prop}:{value};" for prop, value in style_dict.items())
     
+    @_cached_style
     def get_settings_modern_button_style(self):
         """Get modern button style for settings dialog."""
         return f"""
@@ -967,11 +1281,11 @@ class Theme:
                 background-color: {self.colors['highlight']};
                 color: {self.colors['button_text']};
                 border: none;
-                border-radius: {self.dimensions['border_radius']}px;
+                border-radius: {self._dims_flat['border_radius']}px;
                 padding: {self.layout['settings_modern_button_padding']};
                 font-size: 12px;
                 font-weight: {self.fonts['weight_bold']};
-                min-height: {self.dimensions['button_min_height']}px;
+                min-height: {self._dims_flat['button_min_height']}px;
             }}
             QPushButton:hover {{
                 background-color: {self.colors['highlight_hover']};
@@ -981,6 +1295,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_settings_secondary_button_style(self):
         """Get secondary button style for settings dialog."""
         return f"""
@@ -988,11 +1303,11 @@ class Theme:
                 background-color: {self.colors['medium_gray']};
                 color: {self.colors['button_text']};
                 border: none;
-                border-radius: {self.dimensions['border_radius']}px;
+                border-radius: {self._dims_flat['border_radius']}px;
                 padding: {self.layout['settings_secondary_button_padding']};
                 font-size: 12px;
                 font-weight: {self.fonts['weight_bold']};
-                min-height: {self.dimensions['button_min_height']}px;
+                min-height: {self._dims_flat['button_min_height']}px;
             }}
             QPushButton:hover {{
                 background-color: {self.colors['light_gray']};
@@ -1002,6 +1317,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_settings_help_text_style(self):
         """Get help text style for settings dialog."""
         return f"""
@@ -1011,6 +1327,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_settings_danger_group_style(self):
         """Get danger zone group box style for settings dialog."""
         return f"""
@@ -1020,7 +1337,7 @@ class Theme:
                 font-size: 14px;
                 color: #c9c9c9;
                 border: 2px solid {self.colors['error']};
-                border-radius: {self.dimensions['border_radius_large']}px;
+                border-radius: {self._dims_flat['border_radius_large']}px;
                 margin-top: 10px;
                 padding-top: 10px;
                 subcontrol-origin: margin;
@@ -1034,6 +1351,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_settings_danger_button_style(self):
         """Get danger button style for settings dialog."""
         return f"""
@@ -1041,11 +1359,11 @@ class Theme:
                 background-color: {self.colors['error']};
                 color: {self.colors['button_text']};
                 border: none;
-                border-radius: {self.dimensions['border_radius']}px;
+                border-radius: {self._dims_flat['border_radius']}px;
                 padding: {self.layout['settings_danger_button_padding']};
                 font-size: 12px;
                 font-weight: {self.fonts['weight_bold']};
-                min-height: {self.dimensions['button_min_height']}px;
+                min-height: {self._dims_flat['button_min_height']}px;
             }}
             QPushButton:hover {{
                 background-color: {self.colors['error_hover']};
@@ -1055,6 +1373,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_settings_warning_button_style(self):
         """Get warning button style for settings dialog."""
         return f"""
@@ -1062,11 +1381,11 @@ class Theme:
                 background-color: #6b211e;
                 color: {self.colors['button_text']};
                 border: none;
-                border-radius: {self.dimensions['border_radius']}px;
+                border-radius: {self._dims_flat['border_radius']}px;
                 padding: {self.layout['settings_warning_button_padding']};
                 font-size: 12px;
                 font-weight: {self.fonts['weight_bold']};
-                min-height: {self.dimensions['button_min_height']}px;
+                min-height: {self._dims_flat['button_min_height']}px;
             }}
             QPushButton:hover {{
                 background-color: #6b211e;
@@ -1076,6 +1395,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_settings_group_box_style(self):
         """Get standard group box style for settings dialog."""
         return f"""
@@ -1083,8 +1403,8 @@ class Theme:
                 background-color: {self.colors['central_widget']};
                 font-weight: {self.fonts['weight_bold']};
                 font-size: 14px;
-                border: {self.dimensions['border_width']}px solid {self.colors['border']};
-                border-radius: {self.dimensions['border_radius']}px;
+                border: {self._dims_flat['border_width']}px solid {self.colors['border']};
+                border-radius: {self._dims_flat['border_radius']}px;
                 margin-top: {self.layout['group_margin_top']}px;
                 padding-top: {self.spacing['xlarge']}px;
                 color: {self.colors['text']};
@@ -1106,6 +1426,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_settings_transparent_group_box_style(self):
         """Get transparent group box style for settings dialog."""
         return f"""
@@ -1113,8 +1434,8 @@ class Theme:
                 background: transparent;
                 font-weight: {self.fonts['weight_bold']};
                 font-size: 14px;
-                border: {self.dimensions['border_width']}px solid {self.colors['border']};
-                border-radius: {self.dimensions['border_radius']}px;
+                border: {self._dims_flat['border_width']}px solid {self.colors['border']};
+                border-radius: {self._dims_flat['border_radius']}px;
                 margin-top: {self.layout['group_margin_top']}px;
                 padding-top: {self.spacing['xlarge']}px;
                 color: {self.colors['text']};
@@ -1145,13 +1466,14 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_settings_combo_box_style(self):
         """Get combo box style for settings dialog."""
         return f"""
             QComboBox {{
                 background-color: #2c2c2c;
-                border: {self.dimensions['border_width']}px solid {self.colors['border']};
-                border-radius: {self.dimensions['border_radius']}px;
+                border: {self._dims_flat['border_width']}px solid {self.colors['border']};
+                border-radius: {self._dims_flat['border_radius']}px;
                 padding: {self.layout['input_padding']};
                 font-size: 12px;
                 min-width: 150px;
@@ -1162,16 +1484,17 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_system_combo_box_style(self):
         """Get combo box style for system selection."""
         return f"""
             QComboBox {{
                 background-color: {self.colors['group_bg']};
                 border: 1px solid {self.colors['border']};
-                border-radius: {self.dimensions['border']['radius']}px;
+                border-radius: {self._dims_flat['border_radius']}px;
                 padding: 6px 6px 6px 6px; /* Adjusted to have 12px bottom padding */
                 color: {self.colors['text']};
-                min-height: {self.dimensions['widget']['combo_min_height']}px;
+                min-height: {self._dims_flat['combo_min_height']}px;
             }}
             
             QComboBox::drop-down {{
@@ -1201,6 +1524,7 @@ class Theme:
     
     # Drag and Drop Styling Methods
     
+    @_cached_style
     def get_drag_drop_highlight_style(self):
         """Get drag and drop highlight style for DragDropListWidget."""
         # This style is applied directly to the DragDropListWidget instance.
@@ -1223,12 +1547,13 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_drag_drop_normal_style(self):
         """Get normal style for DragDropListWidget."""
         # This style is applied directly to the DragDropListWidget instance.
         return f"""
             QListWidget {{
-                border: {self.dimensions['border_width']}px solid {self.colors['border']};
+                border: {self._dims_flat['border_width']}px solid {self.colors['border']};
                 background-color: #2c2c2c;
                 outline: none !important;
                 font-family: {self.fonts['family']};
@@ -1245,98 +1570,30 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_drag_drop_available_list_style(self):
         """Get available regions list style."""
-        return f"""
-            QListWidget {{
-                border: none;
-                outline: none;
-                background-color: {self.colors['drag_drop']['available_bg']};
-                color: {self.colors['drag_drop']['available_text']};
-                font-family: {self.fonts['family']};
-                font-size: {self.fonts['size_medium']}px;
-                font-weight: normal;
-            }}
-            QListWidget::item {{
-                padding: {self.spacing['small']}px;
-                border: none;
-                outline: none;
-                font-family: {self.fonts['family']};
-                font-size: {self.fonts['size_medium']}px;
-                font-weight: normal;
-            }}
-            QListWidget::item:selected {{
-                background-color: {self.colors['drag_drop']['available_bg']}; /* Keep same as item background */
-                color: {self.colors['drag_drop']['available_text']};
-                border: none;
-                outline: none;
-                font-family: {self.fonts['family']};
-                font-size: {self.fonts['size_medium']}px;
-                font-weight: normal;
-            }}
-            QListWidget::item:selected:active {{
-                background-color: {self.colors['drag_drop']['available_bg']};
-                color: {self.colors['drag_drop']['available_text']};
-                border: none;
-                outline: none;
-            }}
-            QListWidget::item:selected:focus {{
-                background-color: {self.colors['drag_drop']['available_bg']};
-                color: {self.colors['drag_drop']['available_text']};
-                border: none;
-                outline: none;
-            }}
-            QListWidget::item:hover {{
-                background-color: {self.colors['drag_drop']['available_hover_bg']};
-                color: {self.colors['drag_drop']['available_hover_text']};
-                border: none;
-                outline: none;
-            }}
-        """
+        return self._get_drag_drop_list_style('available')
     
+    @_cached_style
     def get_drag_drop_ignored_list_style(self):
         """Get ignored regions list style."""
-        return f"""
-            QListWidget {{
-                border: none;
-                outline: none;
-                background-color: {self.colors['drag_drop']['ignored_bg']};
-                color: {self.colors['drag_drop']['ignored_text']};
-                font-family: {self.fonts['family']};
-                font-size: {self.fonts['size_medium']}px;
-                font-weight: normal;
-            }}
-            QListWidget::item {{
-                padding: {self.spacing['small']}px;
-                border: none;
-                outline: none;
-            }}
-            QListWidget::item:selected {{
-                background-color: {self.colors['drag_drop']['ignored_bg']}; /* Keep same as item background */
-                color: {self.colors['drag_drop']['ignored_text']};
-                border: none;
-                outline: none;
-            }}
-            QListWidget::item:selected:active {{
-                background-color: {self.colors['drag_drop']['ignored_bg']};
-                color: {self.colors['drag_drop']['ignored_text']};
-                border: none;
-                outline: none;
-            }}
-            QListWidget::item:selected:focus {{
-                background-color: {self.colors['drag_drop']['ignored_bg']};
-                color: {self.colors['drag_drop']['ignored_text']};
-                border: none;
-                outline: none;
-            }}
-            QListWidget::item:hover {{
-                background-color: {self.colors['drag_drop']['ignored_hover_bg']};
-                color: {self.colors['drag_drop']['ignored_hover_text']};
-                border: none;
-                outline: none;
-            }}
-        """
+        return self._get_drag_drop_list_style('ignored')
+    
+    def _get_drag_drop_list_style(self, variant):
+        """Render the drag-drop list template for the 'available' or 'ignored' colors."""
+        colors = self.colors
+        return _DRAG_LIST_TEMPLATE.format(
+            bg=colors[f'drag_drop_{variant}_bg'],
+            text=colors[f'drag_drop_{variant}_text'],
+            hover_bg=colors[f'drag_drop_{variant}_hover_bg'],
+            hover_text=colors[f'drag_drop_{variant}_hover_text'],
+            font_family=self.fonts['family'],
+            font_size=self.fonts['size_medium'],
+            padding=self.spacing['small'],
+        )
     
+    @_cached_style
     def get_drag_drop_title_style(self):
         """Get title label style for drag and drop widgets."""
         return f"""
@@ -1357,6 +1614,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_drag_drop_label_style(self):
         """Get label style for drag and drop widgets."""
         return f"""
@@ -1365,6 +1623,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_drag_drop_button_style(self):
         """Get button style for drag and drop widgets."""
         return f"""
@@ -1378,23 +1637,25 @@ class Theme:
             }}
             QPushButton:hover {{
                 background-color: {self.colors['light_gray']};
-                border-radius: {self.dimensions['border_radius_small']}px;
+                border-radius: {self._dims_flat['border_radius_small']}px;
             }}
         """
     
+    @_cached_style
     def get_progress_dialog_details_style(self):
         """Get details label style for progress dialog."""
         return f"""
             QLabel {{
-                color: {self.colors['progress_dialog']['details_text']};
-                font-size: {self.colors['progress_dialog']['details_font_size']};
+                color: {self.colors['progress_dialog_details_text']};
+                font-size: {self.colors['progress_dialog_details_font_size']};
             }}
         """
     
     def get_progress_dialog_log_max_height(self):
         """Get maximum height for progress dialog log text."""
-        return self.dimensions['progress_log_max_height']
+        return self._dims_flat['progress_log_max_height']
     
+    @_cached_style
     def get_language_button_style(self):
         """Get style for language selection buttons."""
         return f"""
@@ -1403,7 +1664,7 @@ class Theme:
                 color: {self.colors['button_text']};
                 border: none;
                 padding: {self.spacing['small']}px {self.spacing['medium']}px;
-                border-radius: {self.dimensions['border_radius_small']}px;
+                border-radius: {self._dims_flat['border_radius_small']}px;
                 font-size: {self.fonts['size_small']}px;
             }}
             QPushButton:hover {{
@@ -1411,6 +1672,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_clear_language_button_style(self):
         """Get style for clear language selection buttons."""
         return f"""
@@ -1419,7 +1681,7 @@ class Theme:
                 color: {self.colors['button_text']};
                 border: none;
                 padding: {self.spacing['small']}px {self.spacing['medium']}px;
-                border-radius: {self.dimensions['border_radius_small']}px;
+                border-radius: {self._dims_flat['border_radius_small']}px;
                 font-size: {self.fonts['size_small']}px;
             }}
             QPushButton:hover {{
@@ -1427,6 +1689,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_type_button_style(self):
         """Get style for game type selection buttons."""
         return f"""
@@ -1435,7 +1698,7 @@ class Theme:
                 color: {self.colors['button_text']};
                 border: none;
                 padding: {self.spacing['medium']}px {self.spacing['large']}px;
-                border-radius: {self.dimensions['border_radius_small']}px;
+                border-radius: {self._dims_flat['border_radius_small']}px;
                 font-weight: {self.fonts['weight_bold']};
             }}
             QPushButton:hover {{
@@ -1443,6 +1706,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_clear_type_button_style(self):
         """Get style for clear game type selection buttons."""
         return f"""
@@ -1451,7 +1715,7 @@ class Theme:
                 color: {self.colors['button_text']};
                 border: none;
                 padding: {self.spacing['medium']}px {self.spacing['large']}px;
-                border-radius: {self.dimensions['border_radius_small']}px;
+                border-radius: {self._dims_flat['border_radius_small']}px;
                 font-weight: {self.fonts['weight_bold']};
             }}
             QPushButton:hover {{
@@ -1459,6 +1723,7 @@ class Theme:
             }}
         """
     
+    @_cached_style
     def get_actions_group_style(self):
         """Get style for actions group box."""
         return f"""
@@ -1466,7 +1731,7 @@ class Theme:
                 background: {self.colors['group_bg']};
                 font-weight: {self.fonts['weight_bold']};
                 border: 2px solid #484848; /* Changed to #484848 */
-                border-radius: {self.dimensions['border_radius_medium']}px;
+                border-radius: {self._dims_flat['border_radius_medium']}px;
                 padding: 30px 0px 10px 0px; /* Increased top padding to 40px */
             }}
             QGroupBox::title {{
@@ -1491,24 +1756,21 @@ class Theme:
     
     def get_main_window_minimum_size(self):
         """Get minimum size for main window."""
-        return (self.dimensions.get('main_window_min_width', 1400), 
-                self.dimensions.get('main_window_min_height', 900))
+        return self._sizes['main_window']
     
     def get_progress_dialog_size(self):
         """Get default size for progress dialog."""
-        return (self.dimensions.get('progress_dialog_width', 400), 
-                self.dimensions.get('progress_dialog_height', 200))
+        return self._sizes['progress_dialog']
     
     def get_progress_dialog_expanded_size(self):
         """Get expanded size for progress dialog with log."""
-        return (self.dimensions.get('progress_dialog_width', 400), 
-                self.dimensions.get('progress_dialog_expanded_height', 300))
+        return self._sizes['progress_dialog_expanded']
     
     def get_settings_dialog_size(self):
         """Get default size for settings dialog."""
-        return (self.dimensions.get('settings_dialog_width', 600), 
-                self.dimensions.get('settings_dialog_height', 500))
+        return self._sizes['settings_dialog']
     
+    @_cached_style
     def get_menu_columns_widget_style(self):
         """Get style for menu columns widget with transparent background."""
         return f"""
@@ -1519,19 +1781,20 @@ class Theme:
         """
     
     # Helper methods for theme system enhancement
-    def get_dimension(self, category, key):
+    def get_dimension(self, category, key=None):
         """Get dimension value by category and key.
         
         Args:
-            category (str): The dimension category (e.g., 'widget', 'border', 'main_window')
+            category (str): The dimension category (e.g., 'widget', 'border', 'main_window'),
+                or a flat dimension key (e.g., 'border_radius') when key is omitted
             key (str): The specific dimension key within the category
             
         Returns:
             The dimension value, or None if not found
         """
-        if category in self.dimensions and isinstance(self.dimensions[category], dict):
-            return self.dimensions[category].get(key)
-        return None
+        if key is None:
+            return self._dims_flat.get(category)
+        return self._dims_dotted.get(f"{category}.{key}")
     
     def get_widget_style(self, widget_type, variant='default'):
         """Return complete stylesheet for widget types.
@@ -1543,37 +1806,9 @@ class Theme:
         Returns:
             str: Complete CSS stylesheet for the widget
         """
-        if widget_type == 'button':
-            if variant == 'premium':
-                return self.get_premium_button_style()
-            elif variant == 'drag_drop':
-                return self.get_drag_drop_button_style()
-            else:
-                return self.get_button_style()
-        elif widget_type == 'input':
-            return self.get_input_style()
-        elif widget_type == 'combo':
-            return self.get_combo_style()
-        elif widget_type == 'tree':
-            return self.get_tree_style()
-        elif widget_type == 'list':
-            if variant == 'drag_drop':
-                return self.get_drag_drop_list_style()
-            else:
-                return self.get_list_style()
-        elif widget_type == 'label':
-            if variant == 'drag_drop':
-                return self.get_drag_drop_label_style()
-            elif variant == 'progress_dialog_details':
-                return self.get_progress_dialog_details_style()
-            else:
-                return self.get_label_style()
-        elif widget_type == 'scrollbar':
-            return self.get_scrollbar_style()
-        elif widget_type == 'progress':
-            return self.get_progress_bar_style()
-        else:
-            return ""
+        method_name = (self._WIDGET_DISPATCH.get((widget_type, variant))
+                       or self._WIDGET_DISPATCH.get((widget_type, 'default')))
+        return getattr(self, method_name)() if method_name else ""
     
     def apply_dimensions(self, widget, dimension_key):
         """Helper to apply dimensions to widgets.
@@ -1582,37 +1817,28 @@ class Theme:
             widget: The Qt widget to apply dimensions to
             dimension_key (str): The dimension key to apply
         """
-        from PyQt5.QtWidgets import QWidget
+        from PyQt6.QtWidgets import QWidget
         
         if not isinstance(widget, QWidget):
             return
             
         # Handle legacy flat dimension keys
-        if dimension_key in self.dimensions and not isinstance(self.dimensions[dimension_key], dict):
-            value = self.dimensions[dimension_key]
+        if dimension_key in self._dims_flat:
+            value = self._dims_flat[dimension_key]
             
             # Apply based on dimension key naming convention
-            if 'min_height' in dimension_key:
-                widget.setMinimumHeight(value)
-            elif 'min_width' in dimension_key:
-                widget.setMinimumWidth(value)
-            elif 'maximum_height' in dimension_key or 'max_height' in dimension_key:
-                widget.setMaximumHeight(value)
-            elif 'maximum_width' in dimension_key or 'max_width' in dimension_key:
-                widget.setMaximumWidth(value)
-            elif 'minimum_width' in dimension_key:
-                widget.setMinimumWidth(value)
-            elif 'minimum_height' in dimension_key:
-                widget.setMinimumHeight(value)
-            elif 'width' in dimension_key:
-                widget.setFixedWidth(value)
-            elif 'height' in dimension_key:
-                widget.setFixedHeight(value)
+            key = dimension_key.replace('minimum_', 'min_').replace('maximum_', 'max_')
+            for suffix, setter in _SUFFIX_TO_SETTER.items():
+                if key.endswith(suffix):
+                    getattr(widget, setter)(value)
+                    break
     
+    @_cached_style
     def get_dat_stats_label_style(self):
         """Get style for DAT stats label."""
         return f"font-weight: {self.fonts['weight_bold']}; font-size: {self.fonts['size_small']}px; color: #909090; padding: {self.layout['stats_label_padding']}; background-color: #3e3e3e;"
     
+    @_cached_style
     def get_rom_stats_label_style(self):
         """Get style for ROM stats label."""
         return f"font-weight: {self.fonts['weight_bold']}; font-size: {self.fonts['size_small']}px; color: #909090; padding: {self.layout['stats_label_padding']}; background-color: #3e3e3e;"
@@ -1626,6 +1852,7 @@ class Theme:
         # Set handle width programmatically as CSS width property doesn't work reliably
         splitter.setHandleWidth(10)
         
+    @_cached_style
     def get_status_bar_style(self):
         """Get style for status bar."""
         return f"""
@@ -1647,4 +1874,10 @@ class Theme:
                 height: 0px;
                 background: transparent;
             }}
-        """
\ No newline at end of file
+        """
+
+
+@lru_cache(maxsize=None)
+def get_default_theme():
+    """Get the shared application theme instance."""
+    return Theme()
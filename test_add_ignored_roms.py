@@ -10,10 +10,10 @@ from pathlib import Path
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from core.rom_scanner import ROMStatus
 
 def main():
     """Add test ignored ROMs to the database."""
+    from core.rom_scanner import ROMStatus
     
     # Connect to the database
     db_path = Path.home() / ".romplestiltskin" / "romplestiltskin.db"
@@ -61,16 +61,15 @@ def main():
         }
     ]
     
-    # Insert test ROMs
-    for rom in test_roms:
-        cursor.execute("""
+    # Insert test ROMs in a single transaction
+    rows = [(rom['file_path'], rom['crc32'], rom['status'],
+             rom['original_status'], rom['game_name']) for rom in test_roms]
+    with conn:
+        conn.executemany("""
             INSERT OR REPLACE INTO scanned_roms 
             (file_path, crc32, status, original_status, game_name)
             VALUES (?, ?, ?, ?, ?)
-        """, (rom['file_path'], rom['crc32'], rom['status'], 
-               rom['original_status'], rom['game_name']))
-    
-    conn.commit()
+        """, rows)
     
     # Verify the data was inserted
     cursor.execute("""
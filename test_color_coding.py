@@ -7,12 +7,12 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from core.scanned_roms_manager import ScannedROMsManager, ROMStatus
-from core.db_manager import DatabaseManager
 from pathlib import Path
 
 def test_color_coding():
     """Test the color coding functionality."""
+    from core.scanned_roms_manager import ScannedROMsManager, ROMStatus
+    from core.db_manager import DatabaseManager
     
     # Initialize database
     db_path = "test_roms.db"
@@ -8,31 +8,38 @@ This test:
 4. Verifies the fix works end-to-end
 """
 
+import logging
 import sqlite3
 import os
+import sys
 from pathlib import Path
 
+log = logging.getLogger(__name__)
+
 def setup_test_data():
-    """Create test ignored Missing ROMs in the database."""
+    """Create test ignored Missing ROMs in the database.
+    
+    Returns the open connection so the later phases can reuse it.
+    """
     db_path = Path(os.path.expanduser('~/.romplestiltskin/romplestiltskin.db'))
     if not db_path.exists():
-        print(f"❌ Database not found at: {db_path}")
-        return False, None, None
+        log.error("❌ Database not found at: %s", db_path)
+        return False, None, None, None
     
+    conn = sqlite3.connect(str(db_path))
     try:
-        conn = sqlite3.connect(str(db_path))
         cursor = conn.cursor()
         
         # Find a system to work with
         cursor.execute("SELECT id, system_name FROM systems LIMIT 1")
         system_result = cursor.fetchone()
         if not system_result:
-            print("❌ No systems found in database")
+            log.error("❌ No systems found in database")
             conn.close()
-            return False, None, None
+            return False, None, None, None
         
         system_id, system_name = system_result
-        print(f"✅ Using system: {system_name} (ID: {system_id})")
+        log.info("✅ Using system: %s (ID: %s)", system_name, system_id)
         
         # Create test Missing ROMs that we can ignore
         test_roms = [
@@ -66,26 +73,25 @@ def setup_test_data():
             """, (system_id, rom['crc32']))
             
             created_roms.append(rom['crc32'])
-            print(f"✅ Created ignored Missing ROM: {rom['crc32']}")
+            log.debug("✅ Created ignored Missing ROM: %s", rom['crc32'])
         
         conn.commit()
-        conn.close()
         
-        return True, system_id, created_roms
+        return True, conn, system_id, created_roms
         
     except Exception as e:
-        print(f"❌ Error setting up test data: {e}")
-        return False, None, None
+        log.error("❌ Error setting up test data: %s", e)
+        conn.close()
+        return False, None, None, None
 
 def test_column_fix(system_id, test_crc32s):
     """Test the column index fix for extracting CRC32 values."""
-    print(f"\n🔍 Testing Column Index Fix")
-    print("=" * 40)
+    log.info("\n🔍 Testing Column Index Fix\n%s", "=" * 40)
     
     success_count = 0
     
     for i, crc32 in enumerate(test_crc32s):
-        print(f"\n📋 Testing ROM {i+1}: CRC32={crc32}")
+        log.debug("\n📋 Testing ROM %d: CRC32=%s", i + 1, crc32)
         
         # Simulate the tree item structure from populate_ignored_tree
         tree_item_columns = [
@@ -99,40 +105,37 @@ def test_column_fix(system_id, test_crc32s):
         
         # Test old (buggy) method - column 4
         old_extracted = tree_item_columns[4]
-        print(f"   ❌ OLD method (column 4): '{old_extracted}' (Languages)")
+        log.debug("   ❌ OLD method (column 4): '%s' (Languages)", old_extracted)
         
         # Test new (fixed) method - column 5
         new_extracted = tree_item_columns[5]
-        print(f"   ✅ NEW method (column 5): '{new_extracted}' (CRC32)")
+        log.debug("   ✅ NEW method (column 5): '%s' (CRC32)", new_extracted)
         
         # Verify the fix
         if new_extracted == crc32 and old_extracted != crc32:
-            print(f"   ✅ Column fix: CORRECT")
+            log.debug("   ✅ Column fix: CORRECT")
             success_count += 1
         else:
-            print(f"   ❌ Column fix: FAILED")
+            log.warning("   ❌ Column fix: FAILED for %s", crc32)
     
     overall_success = success_count == len(test_crc32s)
-    print(f"\n{'✅ Column fix test: PASSED' if overall_success else '❌ Column fix test: FAILED'}")
-    print(f"   {success_count}/{len(test_crc32s)} ROMs correctly handled")
+    log.info("\n%s\n   %d/%d ROMs correctly handled",
+             '✅ Column fix test: PASSED' if overall_success else '❌ Column fix test: FAILED',
+             success_count, len(test_crc32s))
     
     return overall_success
 
-def test_unignore_workflow(system_id, test_crc32s):
+def test_unignore_workflow(conn, system_id, test_crc32s):
     """Test the complete unignore workflow with the fix."""
-    print(f"\n🔍 Testing Unignore Workflow")
-    print("=" * 40)
-    
-    db_path = Path(os.path.expanduser('~/.romplestiltskin/romplestiltskin.db'))
+    log.info("\n🔍 Testing Unignore Workflow\n%s", "=" * 40)
     
     try:
-        conn = sqlite3.connect(str(db_path))
         cursor = conn.cursor()
         
         success_count = 0
         
         for crc32 in test_crc32s:
-            print(f"\n📋 Testing unignore for CRC32: {crc32}")
+            log.debug("\n📋 Testing unignore for CRC32: %s", crc32)
             
             # Step 1: Verify ROM is currently ignored
             cursor.execute("""
@@ -142,23 +145,24 @@ def test_unignore_workflow(system_id, test_crc32s):
             
             result = cursor.fetchone()
             if not result:
-                print(f"   ❌ ROM not found in database")
+                log.warning("   ❌ ROM %s not found in database", crc32)
                 continue
                 
             current_status, original_status = result
-            print(f"   📊 Current status: {current_status}")
-            print(f"   📊 Original status: {original_status}")
+            log.debug("   📊 Current status: %s\n   📊 Original status: %s",
+                      current_status, original_status)
             
             if current_status != 'ignored':
-                print(f"   ❌ ROM is not ignored (status: {current_status})")
+                log.warning("   ❌ ROM %s is not ignored (status: %s)", crc32, current_status)
                 continue
                 
             if original_status != 'missing':
-                print(f"   ❌ Original status is not missing (status: {original_status})")
+                log.warning("   ❌ Original status of %s is not missing (status: %s)",
+                            crc32, original_status)
                 continue
             
             # Step 2: Simulate unignore (restore to original status)
-            print(f"   🔄 Simulating unignore...")
+            log.debug("   🔄 Simulating unignore...")
             cursor.execute("""
                 UPDATE scanned_roms 
                 SET status = ?
@@ -173,7 +177,7 @@ def test_unignore_workflow(system_id, test_crc32s):
             
             new_result = cursor.fetchone()
             if new_result and new_result[0] == 'missing':
-                print(f"   ✅ Unignore successful: ROM restored to 'missing' status")
+                log.debug("   ✅ Unignore successful: ROM restored to 'missing' status")
                 success_count += 1
                 
                 # Restore to ignored for cleanup
@@ -183,89 +187,85 @@ def test_unignore_workflow(system_id, test_crc32s):
                     WHERE system_id = ? AND calculated_crc32 = ?
                 """, (system_id, crc32))
             else:
-                print(f"   ❌ Unignore failed: ROM status is {new_result[0] if new_result else 'unknown'}")
+                log.warning("   ❌ Unignore failed for %s: ROM status is %s",
+                            crc32, new_result[0] if new_result else 'unknown')
         
         conn.commit()
-        conn.close()
         
         overall_success = success_count == len(test_crc32s)
-        print(f"\n{'✅ Unignore workflow test: PASSED' if overall_success else '❌ Unignore workflow test: FAILED'}")
-        print(f"   {success_count}/{len(test_crc32s)} ROMs successfully unignored")
+        log.info("\n%s\n   %d/%d ROMs successfully unignored",
+                 '✅ Unignore workflow test: PASSED' if overall_success else '❌ Unignore workflow test: FAILED',
+                 success_count, len(test_crc32s))
         
         return overall_success
         
     except Exception as e:
-        print(f"❌ Error during unignore workflow test: {e}")
+        log.error("❌ Error during unignore workflow test: %s", e)
         return False
 
-def cleanup_test_data(system_id, test_crc32s):
+def cleanup_test_data(conn, system_id, test_crc32s):
     """Clean up test data from the database."""
-    print(f"\n🧹 Cleaning up test data...")
-    
-    db_path = Path(os.path.expanduser('~/.romplestiltskin/romplestiltskin.db'))
+    log.info("\n🧹 Cleaning up test data...")
     
     try:
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-        
-        for crc32 in test_crc32s:
-            cursor.execute("""
+        with conn:
+            conn.executemany("""
                 DELETE FROM scanned_roms 
                 WHERE system_id = ? AND calculated_crc32 = ?
-            """, (system_id, crc32))
-            print(f"   🗑️ Removed test ROM: {crc32}")
-        
-        conn.commit()
-        conn.close()
-        print(f"✅ Cleanup complete")
+            """, [(system_id, crc32) for crc32 in test_crc32s])
+        log.debug("   🗑️ Removed test ROMs: %s", ", ".join(test_crc32s))
+        log.info("✅ Cleanup complete")
         
     except Exception as e:
-        print(f"❌ Error during cleanup: {e}")
+        log.error("❌ Error during cleanup: %s", e)
 
 def main():
     """Run the complete test suite."""
-    print("🔍 Complete Unignore Missing ROMs Fix Test")
-    print("=" * 50)
+    log.info("🔍 Complete Unignore Missing ROMs Fix Test\n%s", "=" * 50)
     
     # Step 1: Setup test data
-    print("\n📋 Step 1: Setting up test data...")
-    setup_success, system_id, test_crc32s = setup_test_data()
+    log.info("\n📋 Step 1: Setting up test data...")
+    setup_success, conn, system_id, test_crc32s = setup_test_data()
     
     if not setup_success:
-        print("❌ Failed to setup test data")
+        log.error("❌ Failed to setup test data")
         return False
     
     try:
         # Step 2: Test column fix
-        print("\n📋 Step 2: Testing column index fix...")
+        log.info("\n📋 Step 2: Testing column index fix...")
         column_fix_success = test_column_fix(system_id, test_crc32s)
         
         # Step 3: Test unignore workflow
-        print("\n📋 Step 3: Testing unignore workflow...")
-        workflow_success = test_unignore_workflow(system_id, test_crc32s)
+        log.info("\n📋 Step 3: Testing unignore workflow...")
+        workflow_success = test_unignore_workflow(conn, system_id, test_crc32s)
         
         # Overall result
         overall_success = column_fix_success and workflow_success
         
-        print(f"\n{'='*50}")
-        print(f"📊 TEST RESULTS:")
-        print(f"   Column Fix: {'✅ PASSED' if column_fix_success else '❌ FAILED'}")
-        print(f"   Workflow: {'✅ PASSED' if workflow_success else '❌ FAILED'}")
-        print(f"   Overall: {'✅ ALL TESTS PASSED' if overall_success else '❌ SOME TESTS FAILED'}")
+        log.info("\n%s\n📊 TEST RESULTS:\n   Column Fix: %s\n   Workflow: %s\n   Overall: %s",
+                 "=" * 50,
+                 '✅ PASSED' if column_fix_success else '❌ FAILED',
+                 '✅ PASSED' if workflow_success else '❌ FAILED',
+                 '✅ ALL TESTS PASSED' if overall_success else '❌ SOME TESTS FAILED')
         
         if overall_success:
-            print(f"\n🎉 The unignore functionality for Missing files is now FIXED!")
-            print(f"   - CRC32 is correctly extracted from column 5 (not column 4)")
-            print(f"   - Ignored Missing ROMs can be properly restored to Missing status")
+            log.info("\n🎉 The unignore functionality for Missing files is now FIXED!\n"
+                     "   - CRC32 is correctly extracted from column 5 (not column 4)\n"
+                     "   - Ignored Missing ROMs can be properly restored to Missing status")
         else:
-            print(f"\n❌ The unignore functionality still has issues")
+            log.info("\n❌ The unignore functionality still has issues")
         
         return overall_success
         
     finally:
         # Step 4: Cleanup
-        print("\n📋 Step 4: Cleaning up...")
-        cleanup_test_data(system_id, test_crc32s)
+        log.info("\n📋 Step 4: Cleaning up...")
+        cleanup_test_data(conn, system_id, test_crc32s)
+        conn.close()
 
 if __name__ == "__main__":
+    # Per-ROM details are only formatted when run with -v
+    logging.basicConfig(level=logging.DEBUG if "-v" in sys.argv[1:] else logging.INFO,
+                        format="%(message)s")
     main()
\ No newline at end of file
@@ -3,91 +3,108 @@
 Script to test unignoring existing ignored Missing ROMs
 """
 
+import io
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from core.settings_manager import SettingsManager
-from core.scanned_roms_manager import ScannedROMsManager
-from core.rom_scanner import ROMStatus
+from test_helpers import _test_db_path
 
 def test_unignore_existing_missing_roms():
     """Test unignoring existing ignored Missing ROMs"""
-    print("🧪 Testing unignore functionality with existing ignored Missing ROMs...")
-    print()
+    from core.scanned_roms_manager import ScannedROMsManager
+    from core.rom_scanner import ROMStatus
+    
+    # The report is collected here and written out in one go at the end
+    out = io.StringIO()
+    print("🧪 Testing unignore functionality with existing ignored Missing ROMs...", file=out)
+    print(file=out)
     
     try:
         # Initialize managers
-        settings_manager = SettingsManager()
-        db_path = settings_manager.get_database_path()
+        db_path = _test_db_path()
         scanned_roms_manager = ScannedROMsManager(db_path)
         
         # Get the ignored Missing ROMs we found earlier
         ignored_missing_crcs = ['7322ebc6', '8cf511a4']
         
-        for crc32 in ignored_missing_crcs:
-            print(f"Testing CRC32: {crc32}")
+        def read_rom(crc32):
+            # system_id=1 for Atari 2600
+            return (scanned_roms_manager.get_rom_by_crc32(1, crc32),
+                    scanned_roms_manager.get_rom_original_status(1, crc32))
+        
+        # Reads only, so they can run side by side; each worker thread gets
+        # its own pooled connection. Writes below stay on this thread.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            rom_reads = list(executor.map(read_rom, ignored_missing_crcs))
+        
+        # 1. Check each ROM is ignored with a Missing original status
+        unignore_crcs = []
+        for crc32, (rom_data, original_status) in zip(ignored_missing_crcs, rom_reads):
+            print(f"Testing CRC32: {crc32}", file=out)
             
-            # 1. Verify it's currently ignored
-            rom_data = scanned_roms_manager.get_rom_by_crc32(1, crc32)  # system_id=1 for Atari 2600
             if rom_data:
-                print(f"  Current status: {rom_data['status']}")
-                print(f"  Original status: {rom_data['original_status']}")
+                print(f"  Current status: {rom_data['status']}", file=out)
+                print(f"  Original status: {rom_data['original_status']}", file=out)
                 
                 if rom_data['status'] == 'ignored' and rom_data['original_status'] == 'missing':
-                    print("  ✅ ROM is correctly ignored with Missing original status")
+                    print("  ✅ ROM is correctly ignored with Missing original status", file=out)
                     
                     # 2. Test getting original status
-                    original_status = scanned_roms_manager.get_rom_original_status(1, crc32)
-                    print(f"  Retrieved original status: {original_status}")
+                    print(f"  Retrieved original status: {original_status}", file=out)
                     
                     if original_status == ROMStatus.MISSING:
-                        print("  ✅ Original status correctly retrieved as MISSING")
-                        
-                        # 3. Test unignoring
-                        print("  Attempting to unignore...")
-                        scanned_roms_manager.update_rom_status(
-                            system_id=1,
-                            new_status=ROMStatus.MISSING,
-                            crc32=crc32
-                        )
-                        
-                        # 4. Verify it's now Missing
-                        updated_rom_data = scanned_roms_manager.get_rom_by_crc32(1, crc32)
-                        if updated_rom_data and updated_rom_data['status'] == 'missing':
-                            print("  ✅ ROM successfully unignored to MISSING status")
-                            
-                            # 5. Re-ignore it for future tests
-                            print("  Re-ignoring for future tests...")
-                            scanned_roms_manager.update_rom_status(
-                                system_id=1,
-                                new_status=ROMStatus.IGNORED,
-                                crc32=crc32,
-                                original_status=ROMStatus.MISSING
-                            )
-                            print("  ✅ ROM re-ignored with original status preserved")
-                        else:
-                            print("  ❌ Failed to unignore ROM")
+                        print("  ✅ Original status correctly retrieved as MISSING", file=out)
+                        unignore_crcs.append(crc32)
                     else:
-                        print(f"  ❌ Wrong original status retrieved: {original_status}")
+                        print(f"  ❌ Wrong original status retrieved: {original_status}", file=out)
                 else:
-                    print(f"  ❌ ROM not in expected state: status={rom_data['status']}, original_status={rom_data['original_status']}")
+                    print(f"  ❌ ROM not in expected state: status={rom_data['status']}, original_status={rom_data['original_status']}", file=out)
             else:
-                print(f"  ❌ ROM not found in database")
+                print(f"  ❌ ROM not found in database", file=out)
+            
+            print(file=out)
+        
+        if unignore_crcs:
+            # 3. Unignore all eligible ROMs in one transaction
+            print(f"Attempting to unignore {len(unignore_crcs)} ROMs...", file=out)
+            scanned_roms_manager.update_rom_statuses_bulk(
+                (1, ROMStatus.MISSING, crc32, None) for crc32 in unignore_crcs
+            )
+            
+            # 4. Verify they are now Missing
+            unignored_crcs = []
+            for crc32 in unignore_crcs:
+                updated_rom_data = scanned_roms_manager.get_rom_by_crc32(1, crc32)
+                if updated_rom_data and updated_rom_data['status'] == 'missing':
+                    print(f"  ✅ {crc32} successfully unignored to MISSING status", file=out)
+                    unignored_crcs.append(crc32)
+                else:
+                    print(f"  ❌ Failed to unignore {crc32}", file=out)
             
-            print()
+            # 5. Re-ignore them for future tests
+            if unignored_crcs:
+                print("  Re-ignoring for future tests...", file=out)
+                scanned_roms_manager.update_rom_statuses_bulk(
+                    (1, ROMStatus.IGNORED, crc32, ROMStatus.MISSING) for crc32 in unignored_crcs
+                )
+                print("  ✅ ROMs re-ignored with original status preserved", file=out)
+            print(file=out)
         
-        print("🎉 Test completed!")
+        print("🎉 Test completed!", file=out)
         return True
         
     except Exception as e:
-        print(f"❌ Test failed with error: {e}")
+        print(f"❌ Test failed with error: {e}", file=out)
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        sys.stdout.write(out.getvalue())
 
 if __name__ == "__main__":
     success = test_unignore_existing_missing_roms()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the test scripts.
+
+By default the scripts run against a throwaway copy of the app database,
+opened with durability turned off since nothing in it needs to survive.
+Set ROMPLESTILTSKIN_TEST_REAL_DB=1 to run them against the real database.
+"""
+
+import atexit
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+# Make the src directory importable even if the caller hasn't added it yet
+_SRC_PATH = str(Path(__file__).parent / "src")
+if _SRC_PATH not in sys.path:
+    sys.path.insert(0, _SRC_PATH)
+
+_REAL_DB_ENV = "ROMPLESTILTSKIN_TEST_REAL_DB"
+
+# No fsync on commit and no journal file; a crash only loses the throwaway copy
+_TEST_DB_PRAGMAS = """
+    PRAGMA synchronous = OFF;
+    PRAGMA journal_mode = MEMORY;
+    PRAGMA temp_store = MEMORY;
+"""
+
+@lru_cache(maxsize=None)
+def _settings():
+    """Get a SettingsManager shared by every test run in this process."""
+    from core.settings_manager import SettingsManager
+    
+    return SettingsManager()
+
+def _use_real_db() -> bool:
+    return os.environ.get(_REAL_DB_ENV, "") not in ("", "0")
+
+@lru_cache(maxsize=None)
+def _test_db_path() -> str:
+    """Get the database path shared by every test run in this process.
+    
+    The copy is deleted when the process exits. If the real database does
+    not exist neither does the returned path, so the scripts' own checks
+    still report it missing.
+    """
+    from core.scanned_roms_manager import ConnectionPool
+    
+    real_path = _settings().get_database_path()
+    if _use_real_db() or not os.path.exists(real_path):
+        return real_path
+    
+    tmp_dir = tempfile.mkdtemp(prefix="romplestiltskin-test-")
+    atexit.register(shutil.rmtree, tmp_dir, ignore_errors=True)
+    # Registered last so it runs first: close the copy before deleting it
+    atexit.register(ConnectionPool.close_all)
+    db_path = os.path.join(tmp_dir, "test.db")
+    
+    source = sqlite3.connect(real_path)
+    try:
+        with sqlite3.connect(db_path) as target:
+            source.backup(target)
+        target.close()
+    finally:
+        source.close()
+    
+    # The managers reuse this thread's pooled connection, so set it up here
+    ConnectionPool.for_path(db_path).connection().executescript(_TEST_DB_PRAGMAS)
+    return db_path
+
+def _connect_test_db() -> sqlite3.Connection:
+    """Open a separate connection to the test database, for raw SQL."""
+    conn = sqlite3.connect(_test_db_path())
+    conn.row_factory = sqlite3.Row
+    if not _use_real_db():
+        conn.executescript(_TEST_DB_PRAGMAS)
+    return conn
+
+@contextmanager
+def _rolled_back(conn: sqlite3.Connection):
+    """Run the block inside a savepoint that is always rolled back.
+    
+    Nothing written on conn in the block persists, so no cleanup is needed.
+    Manager methods that write must be given conn, since their own commit
+    would end the savepoint's transaction.
+    """
+    conn.execute("SAVEPOINT test_data")
+    try:
+        yield conn
+    finally:
+        conn.execute("ROLLBACK TO test_data")
+        conn.execute("RELEASE test_data")
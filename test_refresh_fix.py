@@ -4,7 +4,6 @@ Test script to verify the refresh fix for unignored Missing ROMs.
 This tests whether the self.ignored_crcs attribute is properly updated.
 """
 
-import sqlite3
 import sys
 from pathlib import Path
 
@@ -12,10 +11,13 @@ from pathlib import Path
 src_path = Path(__file__).parent / 'src'
 sys.path.insert(0, str(src_path))
 
-from core.settings_manager import SettingsManager
+from test_helpers import _settings, _test_db_path
 
 def test_refresh_fix():
     """Test that the refresh fix works correctly."""
+    from core.scanned_roms_manager import ScannedROMsManager
+    from core.rom_scanner import ROMStatus
+    
     print("=== Testing Refresh Fix ===")
     
     # Setup test data
@@ -23,107 +25,95 @@ def test_refresh_fix():
     test_crc32 = "REFRESH1234"
     
     # Initialize settings manager
-    settings_manager = SettingsManager()
-    db_path = Path(settings_manager.get_database_path())
+    settings_manager = _settings()
+    db_path = Path(_test_db_path())
     
     if not db_path.exists():
         print(f"❌ Database not found at: {db_path}")
         return
     
-    try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        # Step 1: Add a Missing ROM to the database
-        print("\n1. Adding a Missing ROM to database...")
-        cursor.execute("""
-            INSERT OR REPLACE INTO scanned_roms 
-            (system_id, file_path, file_size, calculated_crc32, status, original_status)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (test_system_id, "/test/refresh_test.zip", 2048, test_crc32, "Missing", "Missing"))
-        conn.commit()
-        print(f"   Added ROM with CRC32: {test_crc32}")
-        
-        # Step 2: Add to ignored list
-        print("\n2. Adding ROM to ignored list...")
-        ignored_crcs = settings_manager.get_ignored_crcs(test_system_id)
-        if test_crc32 not in ignored_crcs:
-            ignored_crcs.append(test_crc32)
-            settings_manager.set_ignored_crcs(test_system_id, ignored_crcs)
-        
-        # Update ROM status to Ignored
-        cursor.execute("""
-            UPDATE scanned_roms 
-            SET status = 'Ignored'
-            WHERE calculated_crc32 = ?
-        """, (test_crc32,))
-        conn.commit()
-        print(f"   ROM {test_crc32} marked as Ignored")
-        
-        # Step 3: Simulate the unignore process
-        print("\n3. Simulating unignore process...")
-        
-        # Remove from ignored list (simulating settings update)
-        ignored_crcs = settings_manager.get_ignored_crcs(test_system_id)
-        if test_crc32 in ignored_crcs:
-            ignored_crcs.remove(test_crc32)
-            settings_manager.set_ignored_crcs(test_system_id, ignored_crcs)
-        
-        # Restore ROM to original status
-        cursor.execute("""
-            UPDATE scanned_roms 
-            SET status = original_status
-            WHERE calculated_crc32 = ?
-        """, (test_crc32,))
-        conn.commit()
-        
-        # Step 4: Verify the fix - simulate what the UI would do
-        print("\n4. Verifying the refresh fix...")
-        
-        # This simulates the line we added: self.ignored_crcs = set(self.settings_manager.get_ignored_crcs(self.current_system_id))
-        updated_ignored_crcs = set(settings_manager.get_ignored_crcs(test_system_id))
-        
-        # Check if the test CRC is no longer in the ignored list
-        if test_crc32 not in updated_ignored_crcs:
-            print(f"   ✅ Fix working: {test_crc32} is no longer in ignored list")
-        else:
-            print(f"   ❌ Fix failed: {test_crc32} is still in ignored list")
-        
-        # Verify ROM status in database
-        cursor.execute("""
-            SELECT status, original_status FROM scanned_roms 
-            WHERE calculated_crc32 = ?
-        """, (test_crc32,))
-        result = cursor.fetchone()
-        
-        if result:
-            print(f"   ROM status: {result['status']}, original: {result['original_status']}")
-            if result['status'] == 'Missing':
-                print("   ✅ ROM status correctly restored to Missing")
-            else:
-                print(f"   ❌ ROM status incorrect: {result['status']}")
-        
-        print("\n✅ Refresh fix test completed successfully!")
-        
-    except Exception as e:
-        print(f"❌ Test failed with error: {e}")
-    finally:
-        # Cleanup: Remove test data
+    # Every ignored-CRC change below is written to the config file once, on exit
+    with settings_manager.batched():
         try:
-            cursor.execute("DELETE FROM scanned_roms WHERE calculated_crc32 = ?", (test_crc32,))
+            scanned_roms_manager = ScannedROMsManager(str(db_path))
+            
+            # Step 1: Add a Missing ROM to the database
+            print("\n1. Adding a Missing ROM to database...")
+            scanned_roms_manager.delete_rom_by_crc(test_system_id, test_crc32)
+            scanned_roms_manager.add_rom(
+                system_id=test_system_id,
+                status=ROMStatus.MISSING,
+                file_path="/test/refresh_test.zip",
+                file_size=2048,
+                crc32=test_crc32,
+                original_status=ROMStatus.MISSING
+            )
+            print(f"   Added ROM with CRC32: {test_crc32}")
+            
+            # Step 2: Add to ignored list
+            print("\n2. Adding ROM to ignored list...")
+            if test_crc32 not in settings_manager.get_ignored_crcs_set(test_system_id):
+                ignored_crcs = settings_manager.get_ignored_crcs(test_system_id) + [test_crc32]
+                settings_manager.set_ignored_crcs(ignored_crcs, test_system_id)
+            
+            # Update ROM status to Ignored
+            scanned_roms_manager.update_rom_status(test_system_id, ROMStatus.IGNORED, crc32=test_crc32)
+            print(f"   ROM {test_crc32} marked as Ignored")
+            
+            # Step 3: Simulate the unignore process
+            print("\n3. Simulating unignore process...")
+            
+            # Remove from ignored list (simulating settings update)
+            if test_crc32 in settings_manager.get_ignored_crcs_set(test_system_id):
+                ignored_crcs = [crc for crc in settings_manager.get_ignored_crcs(test_system_id)
+                                if crc != test_crc32]
+                settings_manager.set_ignored_crcs(ignored_crcs, test_system_id)
+            
+            # Restore ROM to original status
+            original_status = scanned_roms_manager.get_rom_original_status(test_system_id, test_crc32)
+            scanned_roms_manager.update_rom_status(test_system_id, original_status, crc32=test_crc32)
             
-            # Clean up ignored CRCs
-            ignored_crcs = settings_manager.get_ignored_crcs(test_system_id)
-            if test_crc32 in ignored_crcs:
-                ignored_crcs.remove(test_crc32)
-                settings_manager.set_ignored_crcs(test_system_id, ignored_crcs)
+            # Step 4: Verify the fix - simulate what the UI would do
+            print("\n4. Verifying the refresh fix...")
             
-            conn.commit()
-            conn.close()
-            print("\n🧹 Cleanup completed")
-        except Exception as cleanup_error:
-            print(f"❌ Cleanup error: {cleanup_error}")
+            # This simulates the line we added: self.ignored_crcs = set(self.settings_manager.get_ignored_crcs(self.current_system_id))
+            updated_ignored_crcs = settings_manager.get_ignored_crcs_set(test_system_id)
+            
+            # Check if the test CRC is no longer in the ignored list
+            if test_crc32 not in updated_ignored_crcs:
+                print(f"   ✅ Fix working: {test_crc32} is no longer in ignored list")
+            else:
+                print(f"   ❌ Fix failed: {test_crc32} is still in ignored list")
+            
+            # Verify ROM status in database
+            result = scanned_roms_manager.get_rom_by_crc32(test_system_id, test_crc32)
+            
+            if result:
+                print(f"   ROM status: {result['status']}, original: {result['original_status']}")
+                if result['status'] == ROMStatus.MISSING.value:
+                    print("   ✅ ROM status correctly restored to Missing")
+                else:
+                    print(f"   ❌ ROM status incorrect: {result['status']}")
+            
+            print("\n✅ Refresh fix test completed successfully!")
+            
+        except Exception as e:
+            print(f"❌ Test failed with error: {e}")
+        finally:
+            # Cleanup: Remove test data
+            try:
+                scanned_roms_manager.delete_rom_by_crc(test_system_id, test_crc32)
+                
+                # Clean up ignored CRCs
+                if test_crc32 in settings_manager.get_ignored_crcs_set(test_system_id):
+                    ignored_crcs = [crc for crc in settings_manager.get_ignored_crcs(test_system_id)
+                                    if crc != test_crc32]
+                    settings_manager.set_ignored_crcs(ignored_crcs, test_system_id)
+                
+                print("\n🧹 Cleanup completed")
+            except Exception as cleanup_error:
+                print(f"❌ Cleanup error: {cleanup_error}")
+
 
 if __name__ == "__main__":
     test_refresh_fix()
\ No newline at end of file
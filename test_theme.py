@@ -10,30 +10,34 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
-from PyQt6.QtWidgets import QApplication, QMainWindow, QLabel
-from PyQt6.QtCore import Qt
 
-def create_test_stylesheet():
-    """Create a simple test stylesheet."""
-    colors = {
-        'background': '#2E2E2E',
-        'text': '#E6E6E6',
-        'highlight': '#2D8CEB'
-    }
-    
-    return f"""
+_TEST_COLORS = {
+    'background': '#2E2E2E',
+    'text': '#E6E6E6',
+    'highlight': '#2D8CEB'
+}
+
+# Built once at import; the colors never change
+_TEST_STYLESHEET = f"""
     QWidget {{
-        background-color: {colors['background']};
-        color: {colors['text']};
+        background-color: {_TEST_COLORS['background']};
+        color: {_TEST_COLORS['text']};
         font-family: 'Segoe UI', Arial, sans-serif;
     }}
     
     QMainWindow {{
-        background-color: {colors['background']};
+        background-color: {_TEST_COLORS['background']};
     }}
     """
 
+def create_test_stylesheet():
+    """Create a simple test stylesheet."""
+    return _TEST_STYLESHEET
+
 def main():
+    from PyQt6.QtWidgets import QApplication, QMainWindow, QLabel
+    from PyQt6.QtCore import Qt
+    
     app = QApplication(sys.argv)
     
     # Test simple stylesheet
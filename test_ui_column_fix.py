@@ -41,6 +41,7 @@ def simulate_ui_unignore_workflow():
         print(f"✅ Found {len(ignored_missing_roms)} ignored Missing ROM(s) in database")
         
         # Step 2: Simulate UI tree item creation (how populate_ignored_tree works)
+        all_correct = True
         for i, (system_id, crc32, original_status, system_name) in enumerate(ignored_missing_roms):
             print(f"\n📋 Testing ROM {i+1}: CRC32={crc32} in '{system_name}'")
             
@@ -68,31 +69,19 @@ def simulate_ui_unignore_workflow():
             if new_extracted_crc32 == crc32:
                 print(f"   ✅ CRC32 extraction: CORRECT")
                 
-                # Step 6: Simulate database lookup with correct CRC32
-                cursor.execute("""
-                    SELECT original_status FROM scanned_roms 
-                    WHERE system_id = ? AND calculated_crc32 = ?
-                """, (system_id, new_extracted_crc32))
-                
-                result = cursor.fetchone()
-                if result and result[0] == 'missing':
-                    print(f"   ✅ Original status lookup: SUCCESS (found '{result[0]}')")
+                # Step 6: Check the original status the UI would look up; the
+                # query above already selected it for this CRC32
+                if original_status == 'missing':
+                    print(f"   ✅ Original status lookup: SUCCESS (found '{original_status}')")
                     print(f"   ✅ Unignore would work: ROM can be restored to MISSING status")
                 else:
                     print(f"   ❌ Original status lookup: FAILED")
                     
             else:
                 print(f"   ❌ CRC32 extraction: FAILED (got '{new_extracted_crc32}', expected '{crc32}')")
+                all_correct = False
         
-        # Step 7: Overall test result
-        all_correct = all(
-            tree_item_columns[5] == crc32 
-            for _, crc32, _, _ in ignored_missing_roms
-            for tree_item_columns in [[
-                "1", "Missing ROM", "Missing", "USA", "En", crc32
-            ]]
-        )
-        
+        # Step 7: Overall test result, from the extraction checks above
         print(f"\n{'='*60}")
         if all_correct:
             print("✅ OVERALL TEST RESULT: PASSED")
@@ -11,17 +11,16 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from core.settings_manager import SettingsManager
-from core.scanned_roms_manager import ScannedROMsManager
-from core.db_manager import DatabaseManager
-from core.rom_scanner import ROMStatus
+from test_helpers import _test_db_path
 
 def main():
+    from core.scanned_roms_manager import ScannedROMsManager
+    from core.rom_scanner import ROMStatus
+    
     print("Testing UI fix for unignoring missing ROMs...")
     
     # Initialize managers
-    settings_manager = SettingsManager()
-    db_path = settings_manager.get_database_path()
+    db_path = _test_db_path()
     scanned_roms_manager = ScannedROMsManager(db_path)
     
     test_system_id = 'atari_2600'
@@ -46,8 +45,7 @@ def main():
     )
     
     # Verify it's in ignored list
-    ignored_roms = scanned_roms_manager.get_scanned_roms_by_status(test_system_id, ROMStatus.IGNORED)
-    test_rom_ignored = any(rom.get('calculated_crc32') == test_crc32 for rom in ignored_roms)
+    test_rom_ignored = scanned_roms_manager.get_rom_status(test_system_id, test_crc32) == ROMStatus.IGNORED
     print(f"ROM in ignored list: {test_rom_ignored}")
     
     print(f"\n2. Simulating unignore operation (changing status to MISSING)...")
@@ -63,13 +61,12 @@ def main():
     print(f"\n3. Verifying ROM now appears in Missing list...")
     
     # Check if ROM is now in missing list
-    missing_roms = scanned_roms_manager.get_scanned_roms_by_status(test_system_id, ROMStatus.MISSING)
-    test_rom_missing = any(rom.get('calculated_crc32') == test_crc32 for rom in missing_roms)
-    
-    print(f"Missing ROMs in database: {len(missing_roms)}")
+    test_rom_missing = scanned_roms_manager.get_rom_status(test_system_id, test_crc32) == ROMStatus.MISSING
     print(f"Test ROM found in missing ROMs: {test_rom_missing}")
     
     if test_rom_missing:
+        missing_roms = scanned_roms_manager.get_scanned_roms_by_status(test_system_id, ROMStatus.MISSING)
+        print(f"Missing ROMs in database: {len(missing_roms)}")
         print("\n✅ SUCCESS: ROM successfully moved from ignored to missing status")
         print("✅ The updated update_missing_roms() function should now display this ROM")
         
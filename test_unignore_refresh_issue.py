@@ -4,7 +4,6 @@ Test script to reproduce and verify the unignore refresh issue.
 This tests whether unignored Missing ROMs properly reappear in the Missing tab.
 """
 
-import sqlite3
 import json
 import os
 import sys
@@ -14,7 +13,7 @@ from pathlib import Path
 src_path = Path(__file__).parent / 'src'
 sys.path.insert(0, str(src_path))
 
-from core.settings_manager import SettingsManager
+from test_helpers import _settings, _test_db_path, _connect_test_db
 
 def test_unignore_refresh_issue():
     """Test the unignore refresh issue using SettingsManager and direct database access."""
@@ -25,17 +24,18 @@ def test_unignore_refresh_issue():
     test_crc32 = "ABCD1234"
     
     # Initialize settings manager
-    settings_manager = SettingsManager()
-    db_path = Path(settings_manager.get_database_path())
+    settings_manager = _settings()
+    db_path = Path(_test_db_path())
     
     if not db_path.exists():
         print(f"❌ Database not found at: {db_path}")
         return
     
     try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+        conn = _connect_test_db()
         cursor = conn.cursor()
+        # Test rows are written inside a savepoint that the cleanup rolls back
+        conn.execute("SAVEPOINT test_data")
         
         # Step 1: Add a Missing ROM to the database
         print("\n1. Adding a Missing ROM to database...")
@@ -44,7 +44,6 @@ def test_unignore_refresh_issue():
             (system_id, file_path, file_size, calculated_crc32, status, original_status)
             VALUES (?, ?, ?, ?, ?, ?)
         """, (test_system_id, "/test/missing_rom.zip", 1024, test_crc32, "Missing", "Missing"))
-        conn.commit()
         
         # Verify it's in the database
         cursor.execute("""
@@ -57,13 +56,9 @@ def test_unignore_refresh_issue():
         # Step 2: Simulate ignoring the ROM (add to settings)
         print("\n2. Simulating ignoring the ROM...")
         
-        # Get current ignored CRCs using SettingsManager
-        ignored_crcs = set(settings_manager.get_ignored_crcs(test_system_id))
-        
-        ignored_crcs.add(test_crc32)
-        
-        # Save back to settings using SettingsManager
-        settings_manager.set_ignored_crcs(test_system_id, list(ignored_crcs))
+        # Add to the ignored CRCs with a single settings write
+        with settings_manager.edit_ignored_crcs(test_system_id) as ignored_crcs:
+            ignored_crcs.add(test_crc32)
         
         print(f"   Ignored CRCs: {ignored_crcs}")
         print(f"   Test CRC32 is ignored: {test_crc32 in ignored_crcs}")
@@ -72,16 +67,15 @@ def test_unignore_refresh_issue():
         print("\n3. Simulating unignoring the ROM...")
         
         # Remove from ignored list using SettingsManager
-        ignored_crcs.discard(test_crc32)
-        settings_manager.set_ignored_crcs(test_system_id, list(ignored_crcs))
+        with settings_manager.edit_ignored_crcs(test_system_id) as ignored_crcs:
+            ignored_crcs.discard(test_crc32)
         
         # Restore to original status (should already be Missing)
         cursor.execute("""
             SELECT original_status FROM scanned_roms 
             WHERE system_id = ? AND calculated_crc32 = ?
         """, (test_system_id, test_crc32))
-        result = cursor.fetchone()
-        original_status = result['original_status'] if result else None
+        original_status, = cursor.fetchone() or (None,)
         print(f"   Original status from database: {original_status}")
         
         if original_status:
@@ -91,8 +85,6 @@ def test_unignore_refresh_issue():
                 WHERE system_id = ? AND calculated_crc32 = ?
             """, (original_status, test_system_id, test_crc32))
         
-        conn.commit()
-        
         # Step 4: Check if the ROM should appear in Missing tab
         print("\n4. Checking if ROM should appear in Missing tab...")
         
@@ -140,19 +132,12 @@ def test_unignore_refresh_issue():
         # Cleanup
         print("\n6. Cleaning up test data...")
         try:
-            cursor.execute("""
-                DELETE FROM scanned_roms 
-                WHERE system_id = ? AND calculated_crc32 = ?
-            """, (test_system_id, test_crc32))
-            
-            # Clean up ignored CRCs using SettingsManager
-            ignored_crcs = set(settings_manager.get_ignored_crcs(test_system_id))
-            if test_crc32 in ignored_crcs:
-                ignored_crcs.discard(test_crc32)
-                settings_manager.set_ignored_crcs(test_system_id, list(ignored_crcs))
-            
-            conn.commit()
+            conn.execute("ROLLBACK TO test_data")
+            conn.execute("RELEASE test_data")
             conn.close()
+            
+            # Clean up ignored CRCs; only written if the CRC is still there
+            settings_manager.mutate_ignored_crcs(test_system_id, remove=[test_crc32])
             print("   Cleanup completed")
         except Exception as e:
             print(f"   Cleanup error: {e}")